@@ -1,18 +1,65 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from app.core.config import settings
 from app.core.security import decode_access_token
 from app.services.firebase_service import firebase_service
+from app.utils.cache import TTLCache
+from app.utils.rate_limit import SlidingWindowLimiter, forwarded_client_ip
 from app.utils.constants import UserRole, COLLECTIONS
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 
 security = HTTPBearer()
 
+# Collection holding each role's user documents
+ROLE_COLLECTIONS = {
+    UserRole.CANDIDATE: COLLECTIONS["CANDIDATES"],
+    UserRole.COMPANY: COLLECTIONS["COMPANIES"]
+}
 
-async def get_current_user(
+# Short-lived cache of user documents keyed by (role, user_id)
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
+
+
+# Per-client-IP admission limit for password-checking endpoints
+login_limiter = SlidingWindowLimiter(
+    limit=settings.LOGIN_RATE_LIMIT,
+    window=settings.LOGIN_RATE_WINDOW_SECONDS
+)
+
+
+async def limit_login_attempts(request: Request) -> None:
+    """Reject clients that exceed LOGIN_RATE_LIMIT attempts per window"""
+    
+    # Keyed on the entry the platform proxy appended to X-Forwarded-For;
+    # leading entries are client-controlled
+    client_ip = forwarded_client_ip(
+        request.headers.get("x-forwarded-for"),
+        request.client.host if request.client else "unknown",
+        settings.TRUSTED_PROXY_HOPS
+    )
+    retry_after = login_limiter.hit(client_ip)
+    
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many attempts, please try again later",
+            headers={"Retry-After": str(int(retry_after) + 1)}
+        )
+
+
+def invalidate_principal(role: str, user_id: str) -> None:
+    """Drop a cached user document after it changes"""
+    principal_cache.delete((role, user_id))
+
+
+async def get_current_principal(
     credentials: HTTPAuthorizationCredentials = Depends(security)
-) -> Dict:
-    """Get current authenticated user"""
+) -> Tuple[str, Dict]:
+    """Get the role claim and user document of the authenticated user"""
     
     token = credentials.credentials
     payload = decode_access_token(token)
@@ -33,60 +80,69 @@ async def get_current_user(
             detail="Invalid authentication credentials"
         )
     
-    # Get user from database based on role
-    if user_role == UserRole.CANDIDATE:
-        user = await firebase_service.get_document(COLLECTIONS["CANDIDATES"], user_id)
-    elif user_role == UserRole.COMPANY:
-        user = await firebase_service.get_document(COLLECTIONS["COMPANIES"], user_id)
-    else:
+    if user_role not in ROLE_COLLECTIONS:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid user role"
         )
     
+    # Get user from database based on role (at most one read per request)
+    cache_key = (user_role, user_id)
+    user = principal_cache.get(cache_key)
+    
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
+        user = await firebase_service.get_document(
+            ROLE_COLLECTIONS[user_role],
+            user_id
         )
+        
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found"
+            )
+        
+        principal_cache.set(cache_key, user)
     
-    return user
+    # Routes may modify the returned dict, so never hand out the cached one
+    return user_role, dict(user)
+
+
+async def get_current_user(
+    principal: Tuple[str, Dict] = Depends(get_current_principal)
+) -> Dict:
+    """Get current authenticated user"""
+    
+    return principal[1]
 
 
 async def get_current_candidate(
-    current_user: Dict = Depends(get_current_user)
+    principal: Tuple[str, Dict] = Depends(get_current_principal)
 ) -> Dict:
     """Ensure current user is a candidate"""
     
-    # Check if user is from candidates collection
-    candidate = await firebase_service.get_document(
-        COLLECTIONS["CANDIDATES"], 
-        current_user["id"]
-    )
+    user_role, user = principal
     
-    if candidate is None:
+    if user_role != UserRole.CANDIDATE:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access forbidden: Candidates only"
         )
     
-    return candidate
+    return user
 
 
 async def get_current_company(
-    current_user: Dict = Depends(get_current_user)
+    principal: Tuple[str, Dict] = Depends(get_current_principal)
 ) -> Dict:
     """Ensure current user is a company"""
     
-    company = await firebase_service.get_document(
-        COLLECTIONS["COMPANIES"],
-        current_user["id"]
-    )
+    user_role, user = principal
     
-    if company is None:
+    if user_role != UserRole.COMPANY:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access forbidden: Companies only"
         )
     
-    return company
\ No newline at end of file
+    return user
@@ -1,14 +1,31 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from app.schemas.candidate import CandidateRegister, CandidateLogin, CandidateResponse
+from app.api.dependencies import limit_login_attempts
 from app.services.firebase_service import firebase_service
-from app.core.security import get_password_hash, verify_password, create_access_token
+from app.core.security import (
+    get_password_hash_async,
+    verify_password_async,
+    create_access_token
+)
 from app.utils.constants import COLLECTIONS, UserRole
+from app.utils.worker_pool import PoolBusy
 from datetime import datetime
 
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
+async def _check_password(plain_password: str, hashed_password: str) -> bool:
+    try:
+        return await verify_password_async(plain_password, hashed_password)
+    except PoolBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy, please try again",
+            headers={"Retry-After": "1"}
+        )
+
+
 @router.post("/register/candidate", response_model=CandidateResponse)
 async def register_candidate(candidate_data: CandidateRegister):
     """Register a new candidate"""
@@ -25,7 +42,14 @@ async def register_candidate(candidate_data: CandidateRegister):
         )
     
     # Hash password
-    hashed_password = get_password_hash(candidate_data.password)
+    try:
+        hashed_password = await get_password_hash_async(candidate_data.password)
+    except PoolBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy, please try again",
+            headers={"Retry-After": "1"}
+        )
     
     # Prepare candidate data
     candidate_dict = {
@@ -39,21 +63,15 @@ async def register_candidate(candidate_data: CandidateRegister):
     }
     
     # Save to Firebase
-    candidate_id = await firebase_service.create_document(
+    candidate = await firebase_service.create_document(
         COLLECTIONS["CANDIDATES"],
         candidate_dict
     )
     
-    # Get created candidate
-    candidate = await firebase_service.get_document(
-        COLLECTIONS["CANDIDATES"],
-        candidate_id
-    )
-    
     return candidate
 
 
-@router.post("/login/candidate")
+@router.post("/login/candidate", dependencies=[Depends(limit_login_attempts)])
 async def login_candidate(login_data: CandidateLogin):
     """Candidate login"""
     
@@ -67,7 +85,7 @@ async def login_candidate(login_data: CandidateLogin):
         )
     
     # Verify password
-    if not verify_password(login_data.password, candidate["password"]):
+    if not await _check_password(login_data.password, candidate["password"]):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password"
@@ -94,7 +112,7 @@ async def login_candidate(login_data: CandidateLogin):
     }
 
 
-@router.post("/login/company")
+@router.post("/login/company", dependencies=[Depends(limit_login_attempts)])
 async def login_company(login_data: CandidateLogin):
     """Company login"""
     
@@ -114,7 +132,7 @@ async def login_company(login_data: CandidateLogin):
     company = companies[0]
     
     # Verify password
-    if not verify_password(login_data.password, company["password"]):
+    if not await _check_password(login_data.password, company["password"]):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password"
@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from app.schemas.candidate import CandidateResponse, CandidateUpdate
-from app.api.dependencies import get_current_candidate
+from app.api.dependencies import get_current_candidate, invalidate_principal
 from app.services.firebase_service import firebase_service
-from app.utils.constants import COLLECTIONS
-from typing import Dict, List
+from app.core.config import settings
+from app.utils.constants import COLLECTIONS, UserRole
+from app.utils.helpers import parse_csv
+from typing import Dict, List, Optional
 
 
 router = APIRouter(prefix="/candidate", tags=["Candidate"])
@@ -45,17 +47,13 @@ async def update_candidate_profile(
         )
     
     # Update in database
-    await firebase_service.update_document(
+    updated_candidate = await firebase_service.update_document(
         COLLECTIONS["CANDIDATES"],
         candidate["id"],
-        update_dict
-    )
-    
-    # Get updated candidate
-    updated_candidate = await firebase_service.get_document(
-        COLLECTIONS["CANDIDATES"],
-        candidate["id"]
+        update_dict,
+        current=candidate
     )
+    invalidate_principal(UserRole.CANDIDATE, candidate["id"])
     
     # Remove password
     updated_candidate.pop("password", None)
@@ -65,14 +63,34 @@ async def update_candidate_profile(
 
 @router.get("/interviews", response_model=List[Dict])
 async def get_candidate_interviews(
+    response: Response,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return"),
     candidate: Dict = Depends(get_current_candidate)
 ):
-    """Get all interviews for the current candidate"""
+    """
+    Get interviews for the current candidate, newest first
+    The cursor for the next page is returned in the X-Next-Cursor header.
+    """
     
-    interviews = await firebase_service.query_documents(
-        COLLECTIONS["INTERVIEWS"],
-        filters=[("candidate_id", "==", candidate["id"])]
-    )
+    try:
+        interviews, next_cursor = await firebase_service.query_page(
+            COLLECTIONS["INTERVIEWS"],
+            filters=[("candidate_id", "==", candidate["id"])],
+            page_size=limit,
+            cursor=cursor,
+            order_by=[("created_at", "desc")],
+            select=parse_csv(fields)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     
     return interviews
 
@@ -1,29 +1,28 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from app.schemas.evaluation import InterviewEvaluation, EvaluationSummary
 from app.api.dependencies import get_current_company
-from app.services.firebase_service import firebase_service
+from app.api.streaming import ndjson_response, wants_ndjson
+from app.services.firebase_service import firebase_service, GET_ALL_CHUNK_SIZE
+from app.core.config import settings
 from app.utils.constants import COLLECTIONS
-from typing import Dict, List
+from app.utils.helpers import parse_csv
+from typing import AsyncIterator, Dict, List, Optional
 
 
 router = APIRouter(prefix="/company", tags=["Company Dashboard"])
 
 
-@router.get("/interviews", response_model=List[Dict])
-async def get_company_interviews(
-    company: Dict = Depends(get_current_company)
-):
-    """Get all interviews for the company"""
+async def _enrich_with_candidates(interviews: List[Dict]) -> List[Dict]:
+    """Add candidate name and email (one batched read for all candidates)"""
     
-    interviews = await firebase_service.get_company_interviews(company["id"])
+    candidates = await firebase_service.get_documents(
+        COLLECTIONS["CANDIDATES"],
+        [interview["candidate_id"] for interview in interviews]
+    )
     
-    # Enrich with candidate info
     enriched_interviews = []
     for interview in interviews:
-        candidate = await firebase_service.get_document(
-            COLLECTIONS["CANDIDATES"],
-            interview["candidate_id"]
-        )
+        candidate = candidates.get(interview["candidate_id"])
         
         enriched_interviews.append({
             **interview,
@@ -34,6 +33,94 @@ async def get_company_interviews(
     return enriched_interviews
 
 
+async def _stream_enriched_interviews(
+    interviews: AsyncIterator[Dict]
+) -> AsyncIterator[Dict]:
+    """Stream interviews, enriching candidates chunk by chunk"""
+    
+    chunk = []
+    async for interview in interviews:
+        chunk.append(interview)
+        
+        if len(chunk) >= GET_ALL_CHUNK_SIZE:
+            for item in await _enrich_with_candidates(chunk):
+                yield item
+            chunk = []
+    
+    if chunk:
+        for item in await _enrich_with_candidates(chunk):
+            yield item
+
+
+def _summary_row(interview: Dict) -> Optional[Dict]:
+    """EvaluationSummary row from an interview's denormalized scores"""
+    
+    evaluation = interview.get("evaluation_summary")
+    
+    if not evaluation:
+        return None
+    
+    return {
+        "interview_id": interview["id"],
+        "overall_score": evaluation["overall_score"],
+        "technical_score": evaluation["technical_score"],
+        "hr_score": evaluation["hr_score"],
+        "recommendation": evaluation["recommendation"]
+    }
+
+
+@router.get("/interviews", response_model=List[Dict])
+async def get_company_interviews(
+    request: Request,
+    response: Response,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return"),
+    company: Dict = Depends(get_current_company)
+):
+    """
+    Get interviews for the company, newest first
+    The cursor for the next page is returned in the X-Next-Cursor header.
+    With ?format=ndjson (or Accept: application/x-ndjson) every interview
+    is streamed as newline-delimited JSON instead, ignoring limit.
+    """
+    
+    select = parse_csv(fields)
+    if select:
+        # Needed for candidate enrichment
+        select.append("candidate_id")
+    
+    try:
+        if wants_ndjson(request):
+            interviews = await firebase_service.stream_documents(
+                COLLECTIONS["INTERVIEWS"],
+                filters=[("company_id", "==", company["id"])],
+                order_by=[("created_at", "desc")],
+                start_after=cursor,
+                select=select
+            )
+            return ndjson_response(_stream_enriched_interviews(interviews))
+        
+        interviews, next_cursor = await firebase_service.query_page(
+            COLLECTIONS["INTERVIEWS"],
+            filters=[("company_id", "==", company["id"])],
+            page_size=limit,
+            cursor=cursor,
+            order_by=[("created_at", "desc")],
+            select=select
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    
+    return await _enrich_with_candidates(interviews)
+
+
 @router.get("/evaluation/{interview_id}", response_model=InterviewEvaluation)
 async def get_interview_evaluation(
     interview_id: str,
@@ -73,27 +160,39 @@ async def get_interview_evaluation(
 
 @router.get("/evaluations/summary", response_model=List[EvaluationSummary])
 async def get_evaluations_summary(
+    request: Request,
     company: Dict = Depends(get_current_company)
 ):
-    """Get summary of all evaluations"""
+    """
+    Get summary of all evaluations
+    Supports ?format=ndjson (or Accept: application/x-ndjson) streaming.
+    """
+    
+    if wants_ndjson(request):
+        interviews = await firebase_service.stream_documents(
+            COLLECTIONS["INTERVIEWS"],
+            filters=[("company_id", "==", company["id"])],
+            select=["evaluation_summary"]
+        )
+        
+        async def rows() -> AsyncIterator[Dict]:
+            async for interview in interviews:
+                row = _summary_row(interview)
+                if row:
+                    yield row
+        
+        return ndjson_response(rows())
     
     # Get all company interviews
     interviews = await firebase_service.get_company_interviews(company["id"])
     
+    # Scores are denormalized onto each evaluated interview
     summaries = []
     for interview in interviews:
-        evaluation = await firebase_service.get_interview_evaluation(
-            interview["id"]
-        )
+        row = _summary_row(interview)
         
-        if evaluation:
-            summaries.append({
-                "interview_id": interview["id"],
-                "overall_score": evaluation["overall_score"],
-                "technical_score": evaluation["technical_score"],
-                "hr_score": evaluation["hr_score"],
-                "recommendation": evaluation["recommendation"]
-            })
+        if row:
+            summaries.append(row)
     
     return summaries
 
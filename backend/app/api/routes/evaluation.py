@@ -2,7 +2,8 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from app.api.dependencies import get_current_candidate, get_current_company
 from app.services.firebase_service import firebase_service
 from app.services.evaluation_service import evaluation_service
-from app.utils.constants import COLLECTIONS, InterviewStatus
+from app.services.job_queue import job_queue
+from app.utils.constants import COLLECTIONS, InterviewStatus, JobType
 from typing import Dict
 
 
@@ -55,19 +56,25 @@ async def generate_evaluation(
             "evaluation": existing_evaluation
         }
     
-    # Generate evaluation
+    # Generate evaluation (or join the run already in progress)
     try:
-        evaluation = await evaluation_service.generate_final_evaluation(interview_id)
-        
-        return {
-            "message": "Evaluation generated successfully",
-            "evaluation": evaluation
-        }
+        evaluation = await evaluation_service.ensure_final_evaluation(interview_id)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error generating evaluation: {str(e)}"
         )
+    
+    if evaluation is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Evaluation is already being generated"
+        )
+    
+    return {
+        "message": "Evaluation generated successfully",
+        "evaluation": evaluation
+    }
 
 
 @router.get("/{interview_id}/status")
@@ -97,13 +104,21 @@ async def get_evaluation_status(
             detail="Not authorized"
         )
     
-    # Check evaluation
-    evaluation = await firebase_service.get_interview_evaluation(interview_id)
+    # Check evaluation (summary is denormalized onto the interview)
+    evaluation = interview.get("evaluation_summary")
+    
+    # Check background evaluation job
+    job = await job_queue.get_job(JobType.EVALUATION, interview_id)
     
     return {
         "interview_id": interview_id,
         "evaluation_exists": evaluation is not None,
         "interview_status": interview["status"],
+        "evaluation_job": {
+            "status": job["status"],
+            "attempts": job["attempts"],
+            "error": job.get("error")
+        } if job else None,
         "evaluation_summary": {
             "overall_score": evaluation.get("overall_score"),
             "recommendation": evaluation.get("recommendation")
@@ -154,6 +169,12 @@ async def delete_evaluation(
         evaluation["id"]
     )
     
+    await firebase_service.update_document(
+        COLLECTIONS["INTERVIEWS"],
+        interview_id,
+        {"evaluation_summary": None}
+    )
+    
     return {
         "message": "Evaluation deleted successfully",
         "interview_id": interview_id
@@ -185,11 +206,11 @@ async def get_candidate_evaluation_summary(
             "evaluations": []
         }
     
-    # Get evaluations for each interview
+    # Scores are denormalized onto each evaluated interview
     evaluations_summary = []
     
     for interview in interviews:
-        evaluation = await firebase_service.get_interview_evaluation(interview["id"])
+        evaluation = interview.get("evaluation_summary")
         
         if evaluation:
             evaluations_summary.append({
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from app.schemas.interview import (
     InterviewCreate,
     InterviewResponse,
@@ -11,16 +11,20 @@ from app.api.dependencies import get_current_candidate, get_current_company
 from app.services.firebase_service import firebase_service
 from app.services.question_generator import question_generator
 from app.services.storage_service import storage_service
-from app.services.evaluation_service import evaluation_service
+from app.services.job_queue import job_queue
+from app.core.config import settings
 from app.utils.constants import (
     COLLECTIONS,
     InterviewStatus,
     InterviewRound,
+    JobStatus,
+    JobType,
     INTERVIEW_CLOSING_MESSAGE,
     TOTAL_QUESTIONS
 )
 from datetime import datetime
 from typing import Dict
+import uuid
 
 
 router = APIRouter(prefix="/interview", tags=["Interview"])
@@ -58,23 +62,35 @@ async def create_interview(
         "created_at": datetime.utcnow()
     }
     
-    interview_id = await firebase_service.create_document(
+    interview = await firebase_service.create_document(
         COLLECTIONS["INTERVIEWS"],
         interview_dict
     )
+    interview_id = interview["id"]
     
-    # Generate questions
-    await question_generator.generate_interview_questions(
-        interview_id=interview_id,
-        job_role=interview_data.job_role,
-        candidate_skills=candidate["resume_data"]["skills"]
+    # Generate questions through the durable job queue so an interrupted
+    # run is resumed after a restart
+    job_id = await job_queue.enqueue(
+        JobType.QUESTION_GENERATION,
+        interview_id,
+        {
+            "interview_id": interview_id,
+            "job_role": interview_data.job_role,
+            "candidate_skills": candidate["resume_data"]["skills"]
+        }
     )
-    
-    interview = await firebase_service.get_document(
-        COLLECTIONS["INTERVIEWS"],
-        interview_id
+    job = await job_queue.wait(
+        job_id,
+        timeout=settings.QUESTION_GENERATION_TIMEOUT_SECONDS
     )
     
+    if job and job["status"] == JobStatus.FAILED:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error generating questions: {job.get('error')}"
+        )
+    
+    # Question generation doesn't touch the interview document
     return interview
 
 
@@ -104,6 +120,18 @@ async def start_interview(
             detail="Not authorized for this interview"
         )
     
+    # Get first question
+    question = await question_generator.get_next_question(
+        interview_id=start_data.interview_id,
+        current_index=0
+    )
+    
+    if not question:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Questions are still being generated"
+        )
+    
     # Update interview status
     await firebase_service.update_document(
         COLLECTIONS["INTERVIEWS"],
@@ -114,13 +142,87 @@ async def start_interview(
         }
     )
     
-    # Get first question
-    question = await question_generator.get_next_question(
-        interview_id=start_data.interview_id,
-        current_index=0
+    return question
+
+
+@router.put("/{interview_id}/answers/{question_id}/audio")
+async def upload_answer_audio(
+    interview_id: str,
+    question_id: str,
+    request: Request,
+    candidate: Dict = Depends(get_current_candidate)
+):
+    """
+    Upload an answer's audio as the raw request body
+    The body is streamed to storage chunk by chunk; afterwards submit the
+    answer with the returned upload_id instead of audio_data.
+    """
+    
+    interview = await firebase_service.get_document(
+        COLLECTIONS["INTERVIEWS"],
+        interview_id
     )
     
-    return question
+    if not interview or interview["candidate_id"] != candidate["id"]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized"
+        )
+    
+    if interview["current_question_index"] >= TOTAL_QUESTIONS:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Interview already completed"
+        )
+    
+    # Browser recorders often label audio+video webm as video/webm
+    content_type = request.headers.get("content-type", "audio/webm")
+    if not content_type.startswith(("audio/", "video/webm")):
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Audio content type required"
+        )
+    
+    max_bytes = settings.MAX_AUDIO_SIZE_MB * 1024 * 1024
+    content_length = request.headers.get("content-length")
+    
+    if content_length == "0":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Empty audio upload"
+        )
+    
+    # Reject declared oversize bodies before reading; chunked bodies are
+    # still checked as they stream
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Audio exceeds {settings.MAX_AUDIO_SIZE_MB}MB"
+        )
+    
+    upload_id = uuid.uuid4().hex
+    
+    try:
+        audio_url = await storage_service.upload_stream(
+            request.stream(),
+            storage_service.audio_blob_name(interview_id, question_id, upload_id),
+            content_type,
+            max_bytes
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Audio exceeds {settings.MAX_AUDIO_SIZE_MB}MB"
+        )
+    
+    # A chunked body can be empty without declaring Content-Length: 0
+    if not audio_url:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Empty audio upload"
+        )
+    
+    return {"audio_url": audio_url, "upload_id": upload_id}
 
 
 @router.post("/submit-answer")
@@ -142,12 +244,36 @@ async def submit_answer(
             detail="Not authorized"
         )
     
+    if interview["current_question_index"] >= TOTAL_QUESTIONS:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Interview already completed"
+        )
+    
     # Upload audio to storage
-    audio_url = await storage_service.upload_base64_audio(
-        base64_audio=answer_data.audio_data,
-        interview_id=answer_data.interview_id,
-        question_id=answer_data.question_id
-    )
+    if answer_data.audio_data:
+        audio_url = await storage_service.upload_base64_audio(
+            base64_audio=answer_data.audio_data,
+            interview_id=answer_data.interview_id,
+            question_id=answer_data.question_id
+        )
+    else:
+        # Streamed beforehand through upload_answer_audio
+        audio_url = None
+        if answer_data.audio_upload_id:
+            audio_url = await storage_service.get_public_url(
+                storage_service.audio_blob_name(
+                    answer_data.interview_id,
+                    answer_data.question_id,
+                    answer_data.audio_upload_id
+                )
+            )
+        
+        if not audio_url:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No audio uploaded for this question"
+            )
     
     # Save answer
     answer_dict = {
@@ -159,27 +285,48 @@ async def submit_answer(
         "timestamp": datetime.utcnow()
     }
     
-    await firebase_service.create_document("answers", answer_dict)
+    # Save the answer and advance progress atomically; the answer slot for
+    # the current index can only be taken once
+    current_index = interview["current_question_index"]
+    next_index = current_index + 1
+    
+    interview_update = {"current_question_index": next_index}
+    if next_index >= TOTAL_QUESTIONS:
+        interview_update.update({
+            "status": InterviewStatus.COMPLETED,
+            "completed_at": datetime.utcnow()
+        })
+    
+    answer_id = await firebase_service.record_answer(
+        answer_data.interview_id,
+        current_index,
+        answer_dict,
+        interview_update
+    )
+    
+    if answer_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Answer already submitted for this question"
+        )
     
-    # Update interview progress
-    next_index = interview["current_question_index"] + 1
+    # Score answers in the background, a group at a time so each group is
+    # one batched request; the final evaluation job scores the remainder
+    batch_size = max(1, settings.ANSWER_EVALUATION_BATCH_SIZE)
+    if next_index < TOTAL_QUESTIONS and next_index % batch_size == 0:
+        await job_queue.enqueue(
+            JobType.ANSWER_EVALUATION,
+            answer_id,
+            {"answer_id": answer_id}
+        )
     
     # Check if interview is complete
     if next_index >= TOTAL_QUESTIONS:
-        # Mark as completed
-        await firebase_service.update_document(
-            COLLECTIONS["INTERVIEWS"],
+        # Queue evaluation to run in the background
+        await job_queue.enqueue(
+            JobType.EVALUATION,
             answer_data.interview_id,
-            {
-                "status": InterviewStatus.COMPLETED,
-                "completed_at": datetime.utcnow(),
-                "current_question_index": next_index
-            }
-        )
-        
-        # Generate evaluation
-        await evaluation_service.generate_final_evaluation(
-            interview_id=answer_data.interview_id
+            {"interview_id": answer_data.interview_id}
         )
         
         return {
@@ -188,13 +335,6 @@ async def submit_answer(
             "next_question": None
         }
     
-    # Update progress
-    await firebase_service.update_document(
-        COLLECTIONS["INTERVIEWS"],
-        answer_data.interview_id,
-        {"current_question_index": next_index}
-    )
-    
     # Get next question
     next_question = await question_generator.get_next_question(
         interview_id=answer_data.interview_id,
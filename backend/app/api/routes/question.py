@@ -123,11 +123,8 @@ async def get_all_interview_questions(
             detail="Not authorized to view this interview"
         )
     
-    # Get all questions
-    questions = await firebase_service.get_interview_questions(interview_id)
-    
-    # Sort by order
-    questions.sort(key=lambda x: x.get("order", 0))
+    # Get all questions (sorted by order)
+    questions = await question_generator.get_interview_questions(interview_id)
     
     return questions
 
@@ -239,7 +236,7 @@ async def get_interview_question_stats(
         )
     
     # Get all questions
-    questions = await firebase_service.get_interview_questions(interview_id)
+    questions = await question_generator.get_interview_questions(interview_id)
     
     # Calculate stats
     total_questions = len(questions)
@@ -0,0 +1,26 @@
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, Dict
+import json
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def wants_ndjson(request: Request) -> bool:
+    """Check whether the client asked for a streamed NDJSON response"""
+    return (
+        request.query_params.get("format") == "ndjson"
+        or NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+    )
+
+
+async def _encode_lines(items: AsyncIterator[Dict]) -> AsyncIterator[str]:
+    async for item in items:
+        yield json.dumps(jsonable_encoder(item)) + "\n"
+
+
+def ndjson_response(items: AsyncIterator[Dict]) -> StreamingResponse:
+    """Stream documents as newline-delimited JSON, one line per item"""
+    return StreamingResponse(_encode_lines(items), media_type=NDJSON_MEDIA_TYPE)
@@ -3,6 +3,8 @@ from app.core.firebase import firebase_conn
 from app.core.security import (
     verify_password,
     get_password_hash,
+    verify_password_async,
+    get_password_hash_async,
     create_access_token,
     decode_access_token
 )
@@ -12,6 +14,8 @@ __all__ = [
     "firebase_conn",
     "verify_password",
     "get_password_hash",
+    "verify_password_async",
+    "get_password_hash_async",
     "create_access_token",
     "decode_access_token"
 ]
\ No newline at end of file
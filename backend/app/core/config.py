@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List
 import os
 
 
@@ -15,14 +15,57 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+    LOGIN_RATE_LIMIT: int = 10
+    LOGIN_RATE_WINDOW_SECONDS: float = 60.0
+    # Proxies in front of the app that append to X-Forwarded-For
+    TRUSTED_PROXY_HOPS: int = 1
     
     # Firebase
     FIREBASE_CREDENTIALS_PATH: str = "./firebase-credentials.json"
     FIREBASE_STORAGE_BUCKET: str
+    STORAGE_HTTP_POOL_SIZE: int = 10
+    HEALTH_PROBE_TIMEOUT_SECONDS: float = 5.0
     
     # Gemini AI
     GEMINI_API_KEY: str
     GEMINI_MODEL: str = "gemini-2.0-flash-exp"
+    GEMINI_MAX_CONCURRENCY: int = 8
+    GEMINI_TIMEOUT_SECONDS: float = 60.0
+    
+    # Evaluation
+    EVALUATION_MAX_PARALLELISM: int = 5
+    EVALUATION_BATCH_SIZE: int = 13
+    ANSWER_EVALUATION_BATCH_SIZE: int = 4
+    EVALUATION_LEASE_SECONDS: float = 60.0
+    EVALUATION_WAIT_SECONDS: float = 120.0
+    
+    # Background jobs
+    JOB_WORKERS: int = 2
+    JOB_PRIORITY_WORKERS: int = 1
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_RETRY_DELAY_SECONDS: float = 5.0
+    JOB_LEASE_SECONDS: float = 300.0
+    JOB_POLL_INTERVAL_SECONDS: float = 1.0
+    JOB_QUEUE_PATH: str = "./data/jobs.sqlite3"
+    QUESTION_GENERATION_TIMEOUT_SECONDS: float = 120.0
+    
+    # Caching
+    QUESTION_CACHE_SIZE: int = 1000
+    QUESTION_CACHE_TTL_SECONDS: float = 3600.0
+    PRINCIPAL_CACHE_SIZE: int = 10000
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 30.0
+    TOKEN_CACHE_SIZE: int = 10000
+    TOKEN_CACHE_TTL_SECONDS: float = 300.0
+    DOCUMENT_CACHE_SIZE: int = 5000
+    # collection:seconds pairs; collections not listed are never cached
+    DOCUMENT_CACHE_TTLS: str = "interviews:5,candidates:60,companies:60,questions:3600,evaluations:30"
+    DOCUMENT_CACHE_LISTENERS: bool = False
+    
+    # Pagination
+    DEFAULT_PAGE_SIZE: int = 100
+    MAX_PAGE_SIZE: int = 500
     
     # CORS - Default to Vercel frontend
     CORS_ORIGINS: str = "https://interview-agent-xi.vercel.app"
@@ -45,6 +88,15 @@ class Settings(BaseSettings):
     def allowed_audio_extensions_list(self) -> List[str]:
         return [ext.strip() for ext in self.ALLOWED_AUDIO_EXTENSIONS.split(",")]
     
+    @property
+    def document_cache_ttls(self) -> Dict[str, float]:
+        ttls = {}
+        for pair in self.DOCUMENT_CACHE_TTLS.split(","):
+            if ":" in pair:
+                collection, seconds = pair.split(":", 1)
+                ttls[collection.strip()] = float(seconds)
+        return ttls
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
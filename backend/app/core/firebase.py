@@ -1,26 +1,49 @@
-import firebase_admin
-from firebase_admin import credentials, firestore, storage
 from app.core.config import settings
+from typing import Dict
+import asyncio
+import inspect
 import json
 import os
+import threading
 
 
 class FirebaseConnection:
+    """
+    Firebase connection manager, initialized on first use.
+    
+    Importing the app neither loads the Firestore/Storage SDKs nor reads
+    credentials; that happens the first time a client is requested. Each
+    client is then built once per process and shared by every service
+    until close() is called on shutdown.
+    """
     _instance = None
     _initialized = False
+    _lock = threading.RLock()
+    
+    _app = None
+    _db = None
+    _async_db = None
+    _storage_client = None
+    _bucket = None
     
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(FirebaseConnection, cls).__new__(cls)
         return cls._instance
     
-    def __init__(self):
-        if not self._initialized:
-            self.initialize()
-            self._initialized = True
+    def _ensure_initialized(self):
+        if self._initialized:
+            return
+        with self._lock:
+            if not self._initialized:
+                self.initialize()
+                FirebaseConnection._initialized = True
     
     def initialize(self):
         """Initialize Firebase Admin SDK"""
+        import firebase_admin
+        from firebase_admin import credentials
+        
         try:
             # Check for environment variable first (Production)
             firebase_creds_env = os.getenv('FIREBASE_CREDENTIALS')
@@ -35,7 +58,7 @@ class FirebaseConnection:
                 cred = credentials.Certificate(settings.FIREBASE_CREDENTIALS_PATH)
                 print("✅ Using Firebase credentials from file")
             
-            firebase_admin.initialize_app(cred, {
+            FirebaseConnection._app = firebase_admin.initialize_app(cred, {
                 'storageBucket': settings.FIREBASE_STORAGE_BUCKET
             })
             print("✅ Firebase initialized successfully")
@@ -46,12 +69,121 @@ class FirebaseConnection:
     @property
     def db(self):
         """Get Firestore database instance"""
-        return firestore.client()
+        if self._db is None:
+            with self._lock:
+                if self._db is None:
+                    from google.cloud import firestore
+                    FirebaseConnection._db = firestore.Client(**self._client_args())
+        return self._db
+    
+    @property
+    def async_db(self):
+        """Get asyncio Firestore database instance"""
+        if self._async_db is None:
+            with self._lock:
+                if self._async_db is None:
+                    from google.cloud import firestore
+                    FirebaseConnection._async_db = firestore.AsyncClient(
+                        **self._client_args()
+                    )
+        return self._async_db
     
     @property
     def bucket(self):
         """Get Firebase Storage bucket instance"""
-        return storage.bucket()
+        if self._bucket is None:
+            with self._lock:
+                if self._bucket is None:
+                    FirebaseConnection._bucket = self._build_bucket()
+        return self._bucket
+    
+    def _client_args(self) -> Dict:
+        self._ensure_initialized()
+        return {
+            "credentials": self._app.credential.get_credential(),
+            "project": self._app.project_id
+        }
+    
+    def _build_bucket(self):
+        """Storage bucket on a client with a pooled, keep-alive HTTP session"""
+        from google.auth.transport.requests import AuthorizedSession
+        from google.cloud import storage
+        from requests.adapters import HTTPAdapter
+        
+        client_args = self._client_args()
+        session = AuthorizedSession(client_args["credentials"])
+        adapter = HTTPAdapter(
+            pool_connections=settings.STORAGE_HTTP_POOL_SIZE,
+            pool_maxsize=settings.STORAGE_HTTP_POOL_SIZE
+        )
+        session.mount("https://", adapter)
+        
+        FirebaseConnection._storage_client = storage.Client(
+            project=client_args["project"],
+            credentials=client_args["credentials"],
+            _http=session
+        )
+        return self._storage_client.bucket(settings.FIREBASE_STORAGE_BUCKET)
+    
+    async def check_health(self) -> Dict[str, str]:
+        """
+        Probe Firestore and Storage with a cheap request each
+        
+        Returns:
+            Component name to "ok" or the error message
+        """
+        timeout = settings.HEALTH_PROBE_TIMEOUT_SECONDS
+        
+        async def probe_firestore():
+            await self.async_db.collection("_health").document("probe").get()
+        
+        async def probe_storage():
+            await asyncio.to_thread(self.bucket.exists)
+        
+        async def run(probe) -> str:
+            try:
+                await asyncio.wait_for(probe(), timeout=timeout)
+                return "ok"
+            except asyncio.TimeoutError:
+                return f"timed out after {timeout}s"
+            except Exception as e:
+                return str(e) or type(e).__name__
+        
+        firestore_status, storage_status = await asyncio.gather(
+            run(probe_firestore),
+            run(probe_storage)
+        )
+        return {"firestore": firestore_status, "storage": storage_status}
+    
+    async def close(self) -> None:
+        """Close every client that was opened (on shutdown)"""
+        with self._lock:
+            db, async_db, storage_client = (
+                self._db, self._async_db, self._storage_client
+            )
+            FirebaseConnection._db = None
+            FirebaseConnection._async_db = None
+            FirebaseConnection._storage_client = None
+            FirebaseConnection._bucket = None
+        
+        for client in (async_db, db):
+            if client is not None:
+                await self._close_firestore(client)
+        
+        if storage_client is not None:
+            storage_client.close()
+    
+    @staticmethod
+    async def _close_firestore(client) -> None:
+        # Firestore clients have no public way to close their gRPC channel,
+        # so close the GAPIC transport (if the client ever opened one); the
+        # async transport's close returns an awaitable
+        api = getattr(client, "_firestore_api_internal", None)
+        if api is not None:
+            closed = api.transport.close()
+            if inspect.isawaitable(closed):
+                await closed
+        client.close()
 
 
 # Global Firebase instance
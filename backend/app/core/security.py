@@ -3,6 +3,10 @@ from typing import Optional, Dict
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.core.config import settings
+from app.utils.cache import TTLCache
+from app.utils.worker_pool import WorkerPool
+import hashlib
+import time
 
 
 # Configure password context with explicit bcrypt rounds
@@ -29,6 +33,25 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+# bcrypt burns ~250ms of CPU per call, so it runs on a bounded pool
+# instead of the event loop (bcrypt releases the GIL while hashing)
+password_hasher = WorkerPool(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+    name="bcrypt"
+)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the hashing pool (raises PoolBusy when saturated)"""
+    return await password_hasher.run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password on the hashing pool (raises PoolBusy when saturated)"""
+    return await password_hasher.run(get_password_hash, password)
+
+
 def create_access_token(data: Dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token"""
     to_encode = data.copy()
@@ -50,14 +73,34 @@ def create_access_token(data: Dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
+# Claims of recently verified tokens, keyed by token hash, so polling
+# clients skip signature verification on every request
+token_cache = TTLCache(
+    maxsize=settings.TOKEN_CACHE_SIZE,
+    ttl=settings.TOKEN_CACHE_TTL_SECONDS
+)
+
+
 def decode_access_token(token: str) -> Optional[Dict]:
     """Decode and verify JWT token"""
+    cache_key = hashlib.sha256(token.encode('utf-8')).hexdigest()
+    payload = token_cache.get(cache_key)
+    
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return dict(payload)
+    
     try:
         payload = jwt.decode(
             token, 
             settings.SECRET_KEY, 
             algorithms=[settings.ALGORITHM]
         )
-        return payload
     except JWTError:
-        return None
\ No newline at end of file
+        return None
+    
+    # Never cache past the token's own expiry
+    if "exp" in payload:
+        ttl = min(settings.TOKEN_CACHE_TTL_SECONDS, payload["exp"] - time.time())
+        token_cache.set(cache_key, dict(payload), ttl=ttl)
+    
+    return payload
\ No newline at end of file
@@ -1,6 +1,9 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.core.firebase import firebase_conn
+from app.core.security import password_hasher
 
 # Import routers directly instead of from __init__.py
 from app.api.routes import auth
@@ -9,6 +12,22 @@ from app.api.routes import company
 from app.api.routes import candidate
 from app.api.routes import evaluation
 from app.api.routes import question
+from app.services.firebase_service import firebase_service
+from app.services.gemini_service import gemini_service
+from app.services.job_queue import job_queue
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background job workers (and cache listeners) for the lifetime of the app"""
+    if settings.DOCUMENT_CACHE_LISTENERS:
+        firebase_service.start_listeners()
+    await job_queue.start()
+    yield
+    await job_queue.stop()
+    firebase_service.stop_listeners()
+    password_hasher.shutdown()
+    await firebase_conn.close()
 
 
 # Create FastAPI app
@@ -16,7 +35,8 @@ app = FastAPI(
     title=settings.APP_NAME,
     version=settings.API_VERSION,
     debug=settings.DEBUG,
-    description="AI-powered interview platform with voice-based assessment"
+    description="AI-powered interview platform with voice-based assessment",
+    lifespan=lifespan
 )
 
 
@@ -27,6 +47,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 
@@ -54,7 +75,30 @@ async def health_check():
     """Health check endpoint"""
     return {
         "status": "healthy",
-        "timestamp": "2024-01-01T00:00:00Z"
+        "timestamp": "2024-01-01T00:00:00Z",
+        "gemini": gemini_service.client.metrics(),
+        "password_hasher": password_hasher.metrics(),
+        "document_cache": {
+            "size": len(firebase_service.cache),
+            "hits": firebase_service.cache.hits,
+            "misses": firebase_service.cache.misses
+        }
+    }
+
+
+
+@app.get("/health/ready")
+async def readiness_check(response: Response):
+    """Readiness probe: checks Firestore and Storage are reachable"""
+    checks = await firebase_conn.check_health()
+    ready = all(result == "ok" for result in checks.values())
+    
+    if not ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    
+    return {
+        "status": "ready" if ready else "unavailable",
+        "checks": checks
     }
 
 
@@ -18,7 +18,7 @@ def setup_cors(app):
             "Origin",
             "X-Requested-With"
         ],
-        expose_headers=["Content-Length", "Content-Range"],
+        expose_headers=["Content-Length", "Content-Range", "X-Next-Cursor"],
         max_age=3600,  # Cache preflight requests for 1 hour
     )
     
@@ -42,16 +42,30 @@ class InterviewResponse(BaseModel):
 class AnswerSubmit(BaseModel):
     interview_id: str = Field(..., description="Interview ID")
     question_id: str = Field(..., description="Question ID")
-    audio_data: str = Field(..., description="Base64 encoded audio data")
+    audio_data: Optional[str] = Field(
+        None,
+        description="Base64 encoded audio data; omit if the audio was streamed "
+                    "to PUT /interview/{interview_id}/answers/{question_id}/audio"
+    )
+    audio_upload_id: Optional[str] = Field(
+        None,
+        description="upload_id returned by the streamed audio upload"
+    )
     video_chunk_url: Optional[str] = Field(None, description="URL to uploaded video chunk")
     answer_text: Optional[str] = Field(None, description="Transcribed answer text")
     duration_seconds: Optional[int] = Field(None, ge=0, description="Answer duration in seconds")
     
     @validator('audio_data')
     def validate_audio_data(cls, v):
-        if not v or len(v) < 10:
+        if v is not None and len(v) < 10:
             raise ValueError('Invalid audio data')
         return v
+    
+    @validator('audio_upload_id')
+    def validate_audio_upload_id(cls, v):
+        if v is not None and (len(v) != 32 or v.strip('0123456789abcdef')):
+            raise ValueError('Invalid audio upload ID')
+        return v
 
 
 class AnswerResponse(BaseModel):
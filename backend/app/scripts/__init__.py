@@ -0,0 +1,4 @@
+"""
+Maintenance commands for Interview Agent System
+Run with: python -m app.scripts.<command>
+"""
\ No newline at end of file
@@ -0,0 +1,64 @@
+"""
+Backfill evaluation_summary on interview documents
+
+Interviews evaluated before summaries were denormalized have no
+evaluation_summary, so they are missing from summary listings. This
+copies the compact scores from every existing evaluation onto its
+interview.
+
+Usage:
+    python -m app.scripts.backfill_evaluation_summaries [--dry-run]
+"""
+from app.services.firebase_service import firebase_service
+from app.services.evaluation_service import evaluation_service
+from app.utils.constants import COLLECTIONS
+import argparse
+import asyncio
+
+
+async def backfill(dry_run: bool = False) -> int:
+    """Write summaries for all evaluations, returns the number updated"""
+    
+    evaluations = await firebase_service.query_documents(COLLECTIONS["EVALUATIONS"])
+    
+    updated = 0
+    for evaluation in evaluations:
+        interview_id = evaluation.get("interview_id")
+        
+        if not interview_id:
+            continue
+        
+        summary = evaluation_service.build_summary(evaluation)
+        print(f"{interview_id}: {summary}")
+        
+        if not dry_run:
+            try:
+                await firebase_service.update_document(
+                    COLLECTIONS["INTERVIEWS"],
+                    interview_id,
+                    {"evaluation_summary": summary}
+                )
+            except Exception as e:
+                print(f"Skipping {interview_id}: {e}")
+                continue
+        
+        updated += 1
+    
+    return updated
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print summaries without writing them"
+    )
+    args = parser.parse_args()
+    
+    updated = asyncio.run(backfill(dry_run=args.dry_run))
+    print(f"✅ {'Would update' if args.dry_run else 'Updated'} {updated} interviews")
+
+
+if __name__ == "__main__":
+    main()
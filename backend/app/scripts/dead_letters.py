@@ -0,0 +1,82 @@
+"""
+Inspect and requeue dead-lettered background jobs
+
+Jobs that exhaust JOB_MAX_ATTEMPTS are parked with status failed in the
+local job store (JOB_QUEUE_PATH). Run this next to the API process, on
+the same volume; requeued jobs are picked up by its running workers.
+
+Usage:
+    python -m app.scripts.dead_letters list [--limit N]
+    python -m app.scripts.dead_letters requeue JOB_ID [JOB_ID ...]
+    python -m app.scripts.dead_letters requeue --all
+"""
+from app.services.job_queue import job_queue
+from datetime import datetime
+from typing import List
+import argparse
+import asyncio
+
+
+async def list_dead_letters(limit: int) -> int:
+    """Print dead-lettered jobs, returns how many were found"""
+    
+    jobs = await job_queue.dead_letters(limit)
+    
+    for job in jobs:
+        failed_at = datetime.fromtimestamp(job["updated_at"]).isoformat(timespec="seconds")
+        print(f"{job['id']}  attempts={job['attempts']}  failed_at={failed_at}")
+        print(f"    error: {job.get('error')}")
+    
+    return len(jobs)
+
+
+async def requeue(job_ids: List[str], all_jobs: bool = False) -> int:
+    """Requeue dead-lettered jobs, returns how many were requeued"""
+    
+    if all_jobs:
+        job_ids = [job["id"] for job in await job_queue.dead_letters(limit=-1)]
+    
+    requeued = 0
+    for job_id in job_ids:
+        if await job_queue.requeue(job_id):
+            print(f"Requeued {job_id}")
+            requeued += 1
+        else:
+            print(f"Skipping {job_id}: not a dead-lettered job")
+    
+    return requeued
+
+
+async def run(args) -> None:
+    try:
+        if args.command == "list":
+            found = await list_dead_letters(args.limit)
+            print(f"✅ {found} dead-lettered jobs")
+        else:
+            requeued = await requeue(args.job_ids, all_jobs=args.all)
+            print(f"✅ Requeued {requeued} jobs")
+    finally:
+        job_queue.store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    list_parser = subparsers.add_parser("list", help="List dead-lettered jobs")
+    list_parser.add_argument("--limit", type=int, default=100, help="Maximum jobs to list")
+    
+    requeue_parser = subparsers.add_parser("requeue", help="Requeue dead-lettered jobs")
+    requeue_parser.add_argument("job_ids", nargs="*", help="Job IDs to requeue")
+    requeue_parser.add_argument("--all", action="store_true", help="Requeue every dead-lettered job")
+    
+    args = parser.parse_args()
+    
+    if args.command == "requeue" and not args.job_ids and not args.all:
+        parser.error("requeue needs job IDs or --all")
+    
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Migrate evaluations and questions to deterministic document IDs
+
+Evaluations move to the interview ID and questions to
+"{interview_id}:{order}". References to the old question IDs on answers
+and evaluations are rewritten, then the old documents are deleted. Safe
+to re-run: documents already under their deterministic ID are skipped.
+
+Usage:
+    python -m app.scripts.migrate_document_ids [--dry-run]
+"""
+from app.services.firebase_service import firebase_service
+from app.utils.constants import COLLECTIONS
+from app.utils.helpers import question_document_id
+from typing import Dict
+import argparse
+import asyncio
+
+
+async def migrate_questions(dry_run: bool) -> Dict[str, str]:
+    """Move questions to deterministic IDs, returns old ID -> new ID"""
+    
+    questions = await firebase_service.query_documents(COLLECTIONS["QUESTIONS"])
+    
+    id_map = {}
+    for question in questions:
+        new_id = question_document_id(question["interview_id"], question.get("order", 0))
+        
+        if question["id"] == new_id:
+            continue
+        
+        id_map[question["id"]] = new_id
+        print(f"question {question['id']} -> {new_id}")
+        
+        if not dry_run:
+            old_id = question["id"]
+            await firebase_service.set_document(
+                COLLECTIONS["QUESTIONS"],
+                new_id,
+                {**question, "id": new_id}
+            )
+            await firebase_service.delete_document(COLLECTIONS["QUESTIONS"], old_id)
+    
+    return id_map
+
+
+async def rewrite_answer_references(id_map: Dict[str, str], dry_run: bool) -> None:
+    """Point answers (and their stored evaluations) at the new question IDs"""
+    
+    answers = await firebase_service.query_documents("answers")
+    
+    for answer in answers:
+        new_id = id_map.get(answer.get("question_id"))
+        
+        if not new_id:
+            continue
+        
+        print(f"answer {answer['id']}: question_id -> {new_id}")
+        
+        if not dry_run:
+            update = {"question_id": new_id}
+            if answer.get("evaluation"):
+                update["evaluation"] = {**answer["evaluation"], "question_id": new_id}
+            await firebase_service.update_document("answers", answer["id"], update)
+
+
+async def migrate_evaluations(id_map: Dict[str, str], dry_run: bool) -> None:
+    """Move evaluations under their interview ID and rewrite question IDs"""
+    
+    evaluations = await firebase_service.query_documents(COLLECTIONS["EVALUATIONS"])
+    
+    # Keep the newest evaluation when an interview has duplicates
+    evaluations.sort(key=lambda e: str(e.get("created_at", "")))
+    latest = {e["interview_id"]: e for e in evaluations if e.get("interview_id")}
+    
+    for evaluation in evaluations:
+        interview_id = evaluation.get("interview_id")
+        old_id = evaluation["id"]
+        
+        if not interview_id:
+            continue
+        
+        question_evaluations = [
+            {**qe, "question_id": id_map.get(qe.get("question_id"), qe.get("question_id"))}
+            for qe in evaluation.get("question_evaluations", [])
+        ]
+        references_changed = question_evaluations != evaluation.get("question_evaluations", [])
+        
+        if old_id == interview_id and not references_changed:
+            continue
+        
+        if latest[interview_id] is evaluation:
+            print(f"evaluation {old_id} -> {interview_id}")
+            if not dry_run:
+                await firebase_service.set_document(
+                    COLLECTIONS["EVALUATIONS"],
+                    interview_id,
+                    {
+                        **evaluation,
+                        "id": interview_id,
+                        "question_evaluations": question_evaluations
+                    }
+                )
+        else:
+            print(f"evaluation {old_id}: duplicate for {interview_id}, removing")
+        
+        if not dry_run and old_id != interview_id:
+            await firebase_service.delete_document(COLLECTIONS["EVALUATIONS"], old_id)
+
+
+async def migrate(dry_run: bool = False) -> None:
+    id_map = await migrate_questions(dry_run)
+    await rewrite_answer_references(id_map, dry_run)
+    await migrate_evaluations(id_map, dry_run)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print planned changes without writing them"
+    )
+    args = parser.parse_args()
+    
+    asyncio.run(migrate(dry_run=args.dry_run))
+    print("✅ Migration complete" if not args.dry_run else "✅ Dry run complete")
+
+
+if __name__ == "__main__":
+    main()
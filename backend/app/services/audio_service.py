@@ -1,4 +1,3 @@
-import speech_recognition as sr
 import base64
 import tempfile
 import os
@@ -7,7 +6,15 @@ from typing import Optional
 
 class AudioService:
     def __init__(self):
-        self.recognizer = sr.Recognizer()
+        self._recognizer = None
+    
+    @property
+    def recognizer(self):
+        """Speech recognizer, created on first use (the import is slow)"""
+        if self._recognizer is None:
+            import speech_recognition as sr
+            self._recognizer = sr.Recognizer()
+        return self._recognizer
     
     async def transcribe_audio(self, audio_base64: str) -> Optional[str]:
         """
@@ -19,6 +26,8 @@ class AudioService:
         Returns:
             Transcribed text or None if transcription fails
         """
+        import speech_recognition as sr
+        
         try:
             # Decode base64 audio
             audio_data = base64.b64decode(audio_base64)
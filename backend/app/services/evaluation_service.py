@@ -1,28 +1,131 @@
 from app.services.gemini_service import gemini_service
 from app.services.firebase_service import firebase_service
+from app.services.job_queue import job_queue
+from app.services.question_generator import question_generator
+from app.core.config import settings
 from app.utils.constants import (
     COLLECTIONS,
     InterviewRound,
+    JobType,
     SCORING_WEIGHTS
 )
-from typing import Dict, List
+from app.utils.singleflight import SingleFlight
+from typing import Dict, List, Optional
 from datetime import datetime
+import asyncio
+import os
+import uuid
 
 
 class EvaluationService:
     
+    def __init__(self):
+        # Final evaluations running in this process, keyed by interview ID
+        self._runs = SingleFlight()
+        # Lease owner identity of this process
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+    
+    async def ensure_final_evaluation(self, interview_id: str) -> Optional[Dict]:
+        """
+        Get the interview's evaluation, generating it at most once
+        
+        Concurrent callers in this process share one run; across processes
+        a lease in the evaluation_leases collection lets a single worker
+        generate while the others wait for its result. The holder renews
+        the lease while it runs, so a crashed holder's lease soon expires
+        and a waiter takes over.
+        
+        Returns:
+            The evaluation, or None if another worker holds the lease and
+            did not finish within EVALUATION_WAIT_SECONDS
+        """
+        evaluation, _ = await self._runs.do(
+            interview_id,
+            lambda: self._run_final_evaluation_once(interview_id)
+        )
+        return evaluation
+    
+    async def _run_final_evaluation_once(self, interview_id: str) -> Optional[Dict]:
+        existing = await firebase_service.get_interview_evaluation(interview_id)
+        if existing:
+            return existing
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.EVALUATION_WAIT_SECONDS
+        
+        while True:
+            # Retried on every poll, so an expired lease (its holder
+            # crashed) is taken over instead of waited out
+            acquired = await firebase_service.acquire_lease(
+                COLLECTIONS["EVALUATION_LEASES"],
+                interview_id,
+                self.owner,
+                settings.EVALUATION_LEASE_SECONDS
+            )
+            if acquired:
+                return await self._generate_under_lease(interview_id)
+            
+            if loop.time() >= deadline:
+                return None
+            
+            await asyncio.sleep(settings.JOB_POLL_INTERVAL_SECONDS)
+            evaluation = await firebase_service.get_interview_evaluation(interview_id)
+            if evaluation:
+                return evaluation
+    
+    async def _generate_under_lease(self, interview_id: str) -> Dict:
+        heartbeat = asyncio.ensure_future(self._renew_lease(interview_id))
+        
+        try:
+            # Another worker may have finished just before we took the lease
+            existing = await firebase_service.get_interview_evaluation(interview_id)
+            if existing:
+                return existing
+            
+            return await self.generate_final_evaluation(interview_id)
+        finally:
+            heartbeat.cancel()
+            await firebase_service.release_lease(
+                COLLECTIONS["EVALUATION_LEASES"],
+                interview_id,
+                self.owner
+            )
+    
+    async def _renew_lease(self, interview_id: str) -> None:
+        """Keep the evaluation lease alive until cancelled or lost"""
+        interval = settings.EVALUATION_LEASE_SECONDS / 3
+        
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                renewed = await firebase_service.renew_lease(
+                    COLLECTIONS["EVALUATION_LEASES"],
+                    interview_id,
+                    self.owner,
+                    settings.EVALUATION_LEASE_SECONDS
+                )
+            except Exception as e:
+                print(f"Error renewing evaluation lease for {interview_id}: {str(e)}")
+                continue
+            
+            if not renewed:
+                print(f"Lost evaluation lease for {interview_id}")
+                return
+    
     async def evaluate_answer(
         self,
         question_id: str,
-        answer_text: str
+        answer_text: str,
+        question: Optional[Dict] = None
     ) -> Dict:
         """Evaluate a single answer"""
         
-        # Get question details
-        question = await firebase_service.get_document(
-            COLLECTIONS["QUESTIONS"],
-            question_id
-        )
+        # Get question details unless the caller already has them
+        if question is None:
+            question = await firebase_service.get_document(
+                COLLECTIONS["QUESTIONS"],
+                question_id
+            )
         
         if not question:
             raise ValueError("Question not found")
@@ -34,6 +137,74 @@ class EvaluationService:
             expected_keywords=question["expected_keywords"]
         )
         
+        return self._build_evaluation(question_id, question, answer_text, evaluation)
+    
+    async def evaluate_answers(
+        self,
+        answers: List[Dict],
+        questions_by_id: Dict[str, Dict]
+    ) -> List[Optional[Dict]]:
+        """
+        Evaluate several answers using batched Gemini requests
+        
+        Answers are split into batches of EVALUATION_BATCH_SIZE, and up to
+        EVALUATION_MAX_PARALLELISM batches run at once. Returns evaluations
+        in answer order, with None for answers that could not be evaluated.
+        """
+        
+        results: List[Optional[Dict]] = [None] * len(answers)
+        
+        evaluable = []
+        for idx, answer in enumerate(answers):
+            if answer["question_id"] in questions_by_id:
+                evaluable.append(idx)
+            else:
+                print(f"Question {answer['question_id']} not found for answer")
+        
+        batch_size = max(1, settings.EVALUATION_BATCH_SIZE)
+        batches = [
+            evaluable[start:start + batch_size]
+            for start in range(0, len(evaluable), batch_size)
+        ]
+        semaphore = asyncio.Semaphore(settings.EVALUATION_MAX_PARALLELISM)
+        
+        async def evaluate_batch(batch: List[int]) -> None:
+            items = []
+            for idx in batch:
+                question = questions_by_id[answers[idx]["question_id"]]
+                items.append({
+                    "question": question["question_text"],
+                    "answer": answers[idx].get("answer_text") or "",
+                    "expected_keywords": question["expected_keywords"]
+                })
+            
+            async with semaphore:
+                scores = await gemini_service.evaluate_answers_batch(items)
+            
+            for idx, score in zip(batch, scores):
+                if score is None:
+                    continue
+                answer = answers[idx]
+                results[idx] = self._build_evaluation(
+                    answer["question_id"],
+                    questions_by_id[answer["question_id"]],
+                    answer.get("answer_text") or "",
+                    score
+                )
+        
+        await asyncio.gather(*(evaluate_batch(batch) for batch in batches))
+        
+        return results
+    
+    def _build_evaluation(
+        self,
+        question_id: str,
+        question: Dict,
+        answer_text: str,
+        evaluation: Dict
+    ) -> Dict:
+        """Turn Gemini criteria scores into a QuestionEvaluation dict"""
+        
         # Calculate overall score (weighted average)
         overall_score = (
             evaluation["accuracy"] * SCORING_WEIGHTS["accuracy"] +
@@ -81,7 +252,7 @@ class EvaluationService:
         )
         
         # Get all questions
-        questions = await firebase_service.get_interview_questions(interview_id)
+        questions = await question_generator.get_interview_questions(interview_id)
         
         # Get all answers
         answers = await firebase_service.query_documents(
@@ -89,24 +260,29 @@ class EvaluationService:
             filters=[("interview_id", "==", interview_id)]
         )
         
-        # Evaluate each answer
+        questions_by_id = {q["id"]: q for q in questions}
+        
+        # Answers scored during the interview already carry their evaluation;
+        # only the ones the background jobs have not reached are scored here
+        pending = [answer for answer in answers if not answer.get("evaluation")]
+        await self._score_answers(pending, questions_by_id)
+        
         question_evaluations = []
+        failed_question_ids = []
         technical_scores = []
         hr_scores = []
         
         for answer in answers:
-            evaluation = await self.evaluate_answer(
-                question_id=answer["question_id"],
-                answer_text=answer.get("answer_text", "")
-            )
+            evaluation = answer.get("evaluation")
+            
+            if not evaluation:
+                failed_question_ids.append(answer["question_id"])
+                continue
             
             question_evaluations.append(evaluation)
             
             # Get question round type
-            question = next(
-                (q for q in questions if q["id"] == answer["question_id"]),
-                None
-            )
+            question = questions_by_id.get(answer["question_id"])
             
             if question:
                 if question["round_type"] == InterviewRound.TECHNICAL:
@@ -114,6 +290,9 @@ class EvaluationService:
                 else:
                     hr_scores.append(evaluation["overall_score"])
         
+        if answers and not question_evaluations:
+            raise RuntimeError("All answer evaluations failed")
+        
         # Calculate average scores
         technical_score = (
             sum(technical_scores) / len(technical_scores) 
@@ -146,20 +325,131 @@ class EvaluationService:
             "hr_score": round(hr_score, 2),
             "overall_score": round(overall_score, 2),
             "question_evaluations": question_evaluations,
+            "failed_question_ids": failed_question_ids,
             "video_recording_url": interview.get("video_recording_url", ""),
             "summary": report["summary"],
             "recommendation": report["recommendation"],
             "created_at": datetime.utcnow()
         }
         
-        # Save evaluation
-        await firebase_service.create_document(
+        # Save evaluation under the interview ID so reruns overwrite it
+        await firebase_service.set_document(
             COLLECTIONS["EVALUATIONS"],
+            interview_id,
             final_evaluation
         )
         
+        # Denormalize the scores onto the interview for summary listings
+        await firebase_service.update_document(
+            COLLECTIONS["INTERVIEWS"],
+            interview_id,
+            {"evaluation_summary": self.build_summary(final_evaluation)}
+        )
+        
         return final_evaluation
+    
+    @staticmethod
+    def build_summary(evaluation: Dict) -> Dict:
+        """Compact scores stored on the interview document"""
+        return {
+            "overall_score": evaluation["overall_score"],
+            "technical_score": evaluation["technical_score"],
+            "hr_score": evaluation["hr_score"],
+            "recommendation": evaluation["recommendation"]
+        }
+    
+    async def _score_answers(
+        self,
+        answers: List[Dict],
+        questions_by_id: Dict[str, Dict]
+    ) -> int:
+        """
+        Evaluate answers in batches and save each result on its answer
+        
+        Returns:
+            Number of answers that could not be evaluated
+        """
+        results = await self.evaluate_answers(answers, questions_by_id)
+        
+        saves = []
+        failed = 0
+        for answer, result in zip(answers, results):
+            if result is None:
+                print(f"Error evaluating answer for question {answer['question_id']}")
+                failed += 1
+                continue
+            
+            answer["evaluation"] = result
+            saves.append(self._save_answer_evaluation(answer["id"], result))
+        
+        await asyncio.gather(*saves)
+        return failed
+    
+    async def _save_answer_evaluation(self, answer_id: str, evaluation: Dict) -> None:
+        """Persist a QuestionEvaluation on its answer document"""
+        try:
+            await firebase_service.update_document(
+                "answers",
+                answer_id,
+                {"evaluation": evaluation}
+            )
+        except Exception as e:
+            print(f"Error saving evaluation for answer {answer_id}: {e}")
+    
+    async def run_answer_evaluation_job(self, payload: Dict) -> None:
+        """
+        Job handler: score the interview's unscored answers up to this one
+        
+        Enqueued every ANSWER_EVALUATION_BATCH_SIZE answers, so the group
+        goes to Gemini as one batched request.
+        """
+        
+        answer = await firebase_service.get_document("answers", payload["answer_id"])
+        
+        if not answer:
+            raise ValueError("Answer not found")
+        
+        interview_id = answer["interview_id"]
+        answers = await firebase_service.query_documents(
+            "answers",
+            filters=[("interview_id", "==", interview_id)]
+        )
+        pending = [
+            other for other in answers
+            if not other.get("evaluation")
+            and other.get("question_index", 0) <= answer.get("question_index", 0)
+        ]
+        
+        if not pending:
+            return
+        
+        questions = await question_generator.get_interview_questions(interview_id)
+        failed = await self._score_answers(pending, {q["id"]: q for q in questions})
+        
+        if failed:
+            # Retried; answers scored this time are skipped
+            raise RuntimeError(f"{failed} answer evaluations failed")
+    
+    async def run_evaluation_job(self, payload: Dict) -> None:
+        """Job handler: generate the final evaluation unless it already exists"""
+        
+        interview_id = payload["interview_id"]
+        
+        if await self.ensure_final_evaluation(interview_id) is None:
+            # Retried with backoff; by then the other worker has finished
+            raise RuntimeError("Evaluation in progress on another worker")
 
 
 # Global instance
-evaluation_service = EvaluationService()
\ No newline at end of file
+evaluation_service = EvaluationService()
+
+job_queue.register(
+    JobType.EVALUATION,
+    evaluation_service.run_evaluation_job,
+    priority=1
+)
+job_queue.register(
+    JobType.ANSWER_EVALUATION,
+    evaluation_service.run_answer_evaluation_job,
+    mirror=False
+)
\ No newline at end of file
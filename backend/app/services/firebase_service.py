@@ -1,62 +1,525 @@
 from app.core.firebase import firebase_conn
-from typing import Dict, List, Optional
+from app.core.config import settings
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from datetime import datetime
-from google.cloud.firestore_v1 import FieldFilter
+import asyncio
+import contextlib
+import copy
+import time
+from app.utils.cache import TTLCache
+from app.utils.helpers import answer_document_id, question_document_id
+from app.utils.singleflight import SingleFlight
+
+
+# Firestore caps a batched write at 500 operations
+BATCH_WRITE_LIMIT = 500
+
+# Documents requested per get_all call in multi-gets
+GET_ALL_CHUNK_SIZE = 100
 
 
 class FirebaseService:
+    """
+    Firestore data access.
+    
+    The Firestore SDK is imported and the client created on first use, so
+    importing the app stays fast and works without credentials.
+    """
+    
     def __init__(self):
-        self.db = firebase_conn.db
+        # Read-through cache of documents keyed by (collection, doc_id),
+        # with a TTL per collection; local writes invalidate entries
+        self.cache_ttls = settings.document_cache_ttls
+        self.cache = TTLCache(maxsize=settings.DOCUMENT_CACHE_SIZE, ttl=0)
+        self._listeners = []
+        
+        # Bumped per document (and per collection) on every invalidation; a
+        # read only fills the cache if nothing was invalidated since it
+        # started. Cleared whenever no read is in flight.
+        self._generations: Dict[tuple, int] = {}
+        self._reads_in_flight = 0
+        
+        # Concurrent identical reads share one Firestore call
+        self._flight = SingleFlight()
+    
+    @property
+    def db(self):
+        # Shared async client, so Firestore round trips never block the event loop
+        return firebase_conn.async_db
+    
+    async def _coalesced(self, key: tuple, fetch):
+        async def tracked():
+            # The shared call may outlive a cancelled caller's _reading
+            with self._reading():
+                return await fetch()
+        
+        result, shared = await self._flight.do(key, tracked)
+        # Every caller of a shared read gets its own copy to mutate
+        return copy.deepcopy(result) if shared else result
+    
+    @contextlib.contextmanager
+    def _reading(self):
+        # Entered before a read takes its generation, so generations are
+        # only reset when no read could still compare against them
+        self._reads_in_flight += 1
+        try:
+            yield
+        finally:
+            self._reads_in_flight -= 1
+            if not self._reads_in_flight:
+                self._generations.clear()
+    
+    # Document cache
+    def _generation(self, collection: str, doc_id: Optional[str] = None) -> int:
+        key = (collection, doc_id) if doc_id is not None else (collection,)
+        return self._generations.get(key, 0)
+    
+    def _cache_get(self, collection: str, doc_id: str) -> Optional[Dict]:
+        if collection not in self.cache_ttls:
+            return None
+        doc = self.cache.get((collection, doc_id))
+        # Callers mutate returned documents, so never hand out the cached one
+        return copy.deepcopy(doc) if doc is not None else None
+    
+    def _cache_set(self, collection: str, doc_id: str, doc: Dict) -> None:
+        ttl = self.cache_ttls.get(collection)
+        if ttl:
+            self.cache.set((collection, doc_id), copy.deepcopy(doc), ttl=ttl)
+    
+    def _cache_fill(self, collection: str, doc_id: str, doc: Dict, generation: int) -> None:
+        """Cache a document read at generation, unless it was invalidated since"""
+        if self._generation(collection, doc_id) == generation:
+            self._cache_set(collection, doc_id, doc)
+    
+    def invalidate(self, collection: str, doc_id: str) -> None:
+        """Drop a cached document and stop in-flight reads from refilling it"""
+        for key in ((collection, doc_id), (collection,)):
+            self._generations[key] = self._generations.get(key, 0) + 1
+        self.cache.delete((collection, doc_id))
+    
+    def start_listeners(self) -> None:
+        """
+        Invalidate cached documents written by other processes
+        
+        Listens (on the sync client's background threads) for documents in
+        each cached collection updated since startup; every change evicts
+        the document so other workers never serve it past the write.
+        """
+        from google.cloud.firestore_v1 import FieldFilter
+        
+        if self._listeners:
+            return
+        
+        since = datetime.utcnow()
+        for collection in self.cache_ttls:
+            query = firebase_conn.db.collection(collection).where(
+                filter=FieldFilter("updated_at", ">=", since)
+            )
+            self._listeners.append(
+                query.on_snapshot(self._on_snapshot(collection))
+            )
+    
+    def stop_listeners(self) -> None:
+        """Unsubscribe the invalidation listeners"""
+        for watch in self._listeners:
+            watch.unsubscribe()
+        self._listeners = []
+    
+    def _on_snapshot(self, collection: str):
+        def callback(docs, changes, read_time):
+            for change in changes:
+                self.invalidate(collection, change.document.id)
+        return callback
     
     # Generic CRUD Operations
-    async def create_document(self, collection: str, data: Dict) -> str:
-        """Create a new document in a collection"""
+    async def create_document(self, collection: str, data: Dict) -> Dict:
+        """
+        Create a new document in a collection
+        
+        Returns:
+            The document as written (with its id and created_at), so
+            callers don't need to read it back
+        """
         doc_ref = self.db.collection(collection).document()
         data['id'] = doc_ref.id
         data['created_at'] = datetime.utcnow()
-        doc_ref.set(data)
-        return doc_ref.id
+        await doc_ref.set(data)
+        self.invalidate(collection, doc_ref.id)
+        self._cache_set(collection, doc_ref.id, data)
+        return data
     
-    async def get_document(self, collection: str, doc_id: str) -> Optional[Dict]:
-        """Get a document by ID"""
+    async def create_documents(self, collection: str, documents: List[Dict]) -> List[str]:
+        """
+        Create several documents with batched writes (one commit per 500)
+        
+        Documents that carry an 'id' are written under it (overwriting any
+        existing document); the rest get an auto-generated ID.
+        """
+        doc_ids = []
+        collection_ref = self.db.collection(collection)
+        
+        for start in range(0, len(documents), BATCH_WRITE_LIMIT):
+            batch = self.db.batch()
+            for data in documents[start:start + BATCH_WRITE_LIMIT]:
+                doc_ref = collection_ref.document(data.get('id') or None)
+                data['id'] = doc_ref.id
+                data['created_at'] = datetime.utcnow()
+                # Lets other processes' listeners see overwrites
+                data['updated_at'] = data['created_at']
+                batch.set(doc_ref, data)
+                doc_ids.append(doc_ref.id)
+            await batch.commit()
+            
+            for data in documents[start:start + BATCH_WRITE_LIMIT]:
+                self.invalidate(collection, data['id'])
+                self._cache_set(collection, data['id'], data)
+        
+        return doc_ids
+    
+    async def set_document(
+        self,
+        collection: str,
+        doc_id: str,
+        data: Dict,
+        merge: bool = False
+    ) -> str:
+        """Create or overwrite a document with a known ID"""
         doc_ref = self.db.collection(collection).document(doc_id)
-        doc = doc_ref.get()
+        data['id'] = doc_id
+        # Always stamped, so other processes' listeners see overwrites too
+        data['updated_at'] = datetime.utcnow()
+        if not merge:
+            data.setdefault('created_at', data['updated_at'])
+        await doc_ref.set(data, merge=merge)
         
-        if doc.exists:
-            return doc.to_dict()
-        return None
+        self.invalidate(collection, doc_id)
+        if not merge:
+            self._cache_set(collection, doc_id, data)
+        return doc_id
     
-    async def update_document(self, collection: str, doc_id: str, data: Dict) -> bool:
-        """Update a document"""
+    async def get_document(self, collection: str, doc_id: str) -> Optional[Dict]:
+        """Get a document by ID (served from the cache when fresh)"""
+        cached = self._cache_get(collection, doc_id)
+        if cached is not None:
+            return cached
+        
+        with self._reading():
+            generation = self._generation(collection, doc_id)
+            
+            async def fetch() -> Optional[Dict]:
+                doc = await self.db.collection(collection).document(doc_id).get()
+                
+                if doc.exists:
+                    data = doc.to_dict()
+                    self._cache_fill(collection, doc_id, data, generation)
+                    return data
+                return None
+            
+            # Keyed by generation, so a caller arriving after a local write
+            # never joins a read that started before it
+            key = ("get", collection, doc_id, generation)
+            return await self._coalesced(key, fetch)
+    
+    async def get_documents(self, collection: str, doc_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Get several documents by ID in a few round trips
+        
+        IDs are de-duplicated and fetched with get_all in parallel chunks.
+        Returns a dict of ID to document; missing documents are omitted.
+        """
+        unique_ids = list(dict.fromkeys(doc_id for doc_id in doc_ids if doc_id))
+        collection_ref = self.db.collection(collection)
+        
+        found = {}
+        for doc_id in unique_ids:
+            cached = self._cache_get(collection, doc_id)
+            if cached is not None:
+                found[doc_id] = cached
+        unique_ids = [doc_id for doc_id in unique_ids if doc_id not in found]
+        
+        async def fetch(chunk: List[str]) -> List:
+            refs = [collection_ref.document(doc_id) for doc_id in chunk]
+            return [doc async for doc in self.db.get_all(refs)]
+        
+        with self._reading():
+            generations = {
+                doc_id: self._generation(collection, doc_id) for doc_id in unique_ids
+            }
+            chunks = await asyncio.gather(*(
+                fetch(unique_ids[start:start + GET_ALL_CHUNK_SIZE])
+                for start in range(0, len(unique_ids), GET_ALL_CHUNK_SIZE)
+            ))
+            
+            for docs in chunks:
+                for doc in docs:
+                    if doc.exists:
+                        found[doc.id] = doc.to_dict()
+                        self._cache_fill(collection, doc.id, found[doc.id], generations[doc.id])
+        
+        return found
+    
+    async def update_document(
+        self,
+        collection: str,
+        doc_id: str,
+        data: Dict,
+        current: Optional[Dict] = None
+    ) -> Optional[Dict]:
+        """
+        Update a document
+        
+        Args:
+            current: The document as last read; if given, it is returned
+                with the (top-level) updated fields applied instead of
+                being read back
+        
+        Returns:
+            The updated document when current is given, else None
+        """
         doc_ref = self.db.collection(collection).document(doc_id)
         data['updated_at'] = datetime.utcnow()
-        doc_ref.update(data)
-        return True
+        try:
+            await doc_ref.update(data)
+        finally:
+            self.invalidate(collection, doc_id)
+        
+        if current is not None:
+            return {**current, **data}
+        return None
     
     async def delete_document(self, collection: str, doc_id: str) -> bool:
         """Delete a document"""
         doc_ref = self.db.collection(collection).document(doc_id)
-        doc_ref.delete()
+        await doc_ref.delete()
+        self.invalidate(collection, doc_id)
         return True
     
     async def query_documents(
         self, 
         collection: str, 
         filters: Optional[List[tuple]] = None,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        order_by: Optional[List[tuple]] = None,
+        start_after: Optional[str] = None,
+        select: Optional[List[str]] = None
     ) -> List[Dict]:
-        """Query documents with filters"""
-        query = self.db.collection(collection)
+        """
+        Query documents with filters
+        
+        Args:
+            collection: Collection name
+            filters: (field, operator, value) tuples
+            limit: Maximum number of documents
+            order_by: (field, "asc"|"desc") tuples
+            start_after: ID of the document to resume after (page cursor)
+            select: Fields to return; "id" is always included
+        """
+        async def fetch() -> List[Dict]:
+            query = await self._build_query(
+                collection, filters, limit, order_by, start_after, select
+            )
+            return [doc.to_dict() async for doc in query.stream()]
+        
+        with self._reading():
+            key = (
+                "query",
+                collection,
+                repr((filters, limit, order_by, start_after, select)),
+                self._generation(collection)
+            )
+            return await self._coalesced(key, fetch)
+    
+    async def stream_documents(
+        self,
+        collection: str,
+        filters: Optional[List[tuple]] = None,
+        order_by: Optional[List[tuple]] = None,
+        start_after: Optional[str] = None,
+        select: Optional[List[str]] = None
+    ) -> AsyncIterator[Dict]:
+        """
+        Stream documents as Firestore returns them
+        
+        Same arguments as query_documents, without building a list, so
+        memory stays flat regardless of result size. The query (and its
+        cursor) is checked before returning, so errors surface before a
+        response has started.
+        
+        Raises:
+            ValueError: If start_after is not an existing document
+        """
+        query = await self._build_query(
+            collection, filters, None, order_by, start_after, select
+        )
+        return self._stream_query(query)
+    
+    async def _stream_query(self, query) -> AsyncIterator[Dict]:
+        async for doc in query.stream():
+            yield doc.to_dict()
+    
+    async def query_page(
+        self,
+        collection: str,
+        filters: Optional[List[tuple]] = None,
+        page_size: int = 100,
+        cursor: Optional[str] = None,
+        order_by: Optional[List[tuple]] = None,
+        select: Optional[List[str]] = None
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Query one page of documents
+        
+        Returns:
+            (documents, next_cursor) where next_cursor is None on the last page
+        """
+        docs = await self.query_documents(
+            collection,
+            filters=filters,
+            limit=page_size + 1,
+            order_by=order_by,
+            start_after=cursor,
+            select=select
+        )
+        
+        if len(docs) > page_size:
+            docs = docs[:page_size]
+            return docs, docs[-1]["id"]
+        
+        return docs, None
+    
+    async def _build_query(
+        self,
+        collection: str,
+        filters: Optional[List[tuple]] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[List[tuple]] = None,
+        start_after: Optional[str] = None,
+        select: Optional[List[str]] = None
+    ):
+        """Build a Firestore query from the query_documents arguments"""
+        from google.cloud.firestore_v1 import FieldFilter
+        
+        collection_ref = self.db.collection(collection)
+        query = collection_ref
         
         if filters:
             for field, operator, value in filters:
                 query = query.where(filter=FieldFilter(field, operator, value))
         
+        if order_by:
+            for field, direction in order_by:
+                query = query.order_by(
+                    field,
+                    direction="DESCENDING" if direction == "desc" else "ASCENDING"
+                )
+        
+        if start_after:
+            cursor = await collection_ref.document(start_after).get()
+            if not cursor.exists:
+                raise ValueError("Invalid cursor")
+            query = query.start_after(cursor)
+        
+        if select:
+            query = query.select(list(dict.fromkeys(["id", *select])))
+        
         if limit:
             query = query.limit(limit)
         
-        docs = query.stream()
-        return [doc.to_dict() for doc in docs]
+        return query
+    
+    # Leases
+    async def acquire_lease(
+        self,
+        collection: str,
+        doc_id: str,
+        owner: str,
+        lease_seconds: float
+    ) -> bool:
+        """
+        Take an exclusive, expiring lease stored as a document
+        
+        The lease is created with a must-not-exist precondition; an expired
+        lease is taken over with an update conditioned on its last update
+        time, so exactly one contender wins either way.
+        
+        Returns:
+            True if owner now holds the lease
+        """
+        from google.api_core.exceptions import AlreadyExists, FailedPrecondition, NotFound
+        
+        doc_ref = self.db.collection(collection).document(doc_id)
+        lease = {
+            "id": doc_id,
+            "owner": owner,
+            "expires_at": time.time() + lease_seconds,
+            "acquired_at": datetime.utcnow()
+        }
+        
+        try:
+            await doc_ref.create(lease)
+            return True
+        except AlreadyExists:
+            pass
+        
+        snapshot = await doc_ref.get()
+        if not snapshot.exists or snapshot.get("expires_at") > time.time():
+            return False
+        
+        try:
+            await doc_ref.update(
+                lease,
+                option=self.db.write_option(last_update_time=snapshot.update_time)
+            )
+            return True
+        except (FailedPrecondition, NotFound):
+            return False
+    
+    async def renew_lease(
+        self,
+        collection: str,
+        doc_id: str,
+        owner: str,
+        lease_seconds: float
+    ) -> bool:
+        """
+        Extend a lease owner still holds
+        
+        Returns:
+            False if the lease was lost (expired and taken over, or released)
+        """
+        from google.api_core.exceptions import FailedPrecondition, NotFound
+        
+        doc_ref = self.db.collection(collection).document(doc_id)
+        snapshot = await doc_ref.get()
+        
+        if not snapshot.exists or snapshot.get("owner") != owner:
+            return False
+        
+        try:
+            await doc_ref.update(
+                {"expires_at": time.time() + lease_seconds},
+                option=self.db.write_option(last_update_time=snapshot.update_time)
+            )
+            return True
+        except (FailedPrecondition, NotFound):
+            return False
+    
+    async def release_lease(self, collection: str, doc_id: str, owner: str) -> None:
+        """Delete a lease if owner still holds it"""
+        from google.api_core.exceptions import FailedPrecondition, NotFound
+        
+        doc_ref = self.db.collection(collection).document(doc_id)
+        snapshot = await doc_ref.get()
+        
+        if not snapshot.exists or snapshot.get("owner") != owner:
+            return
+        
+        try:
+            await doc_ref.delete(
+                option=self.db.write_option(last_update_time=snapshot.update_time)
+            )
+        except (FailedPrecondition, NotFound):
+            pass
     
     # Candidate Operations
     async def get_candidate_by_email(self, email: str) -> Optional[Dict]:
@@ -88,7 +551,54 @@ class FirebaseService:
             "question_id": question_id,
             "timestamp": datetime.utcnow()
         })
-        return await self.create_document("answers", answer_data)
+        answer = await self.create_document("answers", answer_data)
+        return answer["id"]
+    
+    async def record_answer(
+        self,
+        interview_id: str,
+        question_index: int,
+        answer_data: Dict,
+        interview_update: Dict
+    ) -> Optional[str]:
+        """
+        Save an answer and advance the interview in one atomic batch
+        
+        The answer is created under answer_document_id(interview_id,
+        question_index) with a must-not-exist precondition, so the slot
+        acts as an optimistic lock on current_question_index: a duplicate
+        or stale submit for the same index fails the whole batch and
+        leaves the interview untouched.
+        
+        Returns:
+            Answer ID, or None if that question was already answered
+        """
+        from google.api_core.exceptions import AlreadyExists
+        
+        answer_id = answer_document_id(interview_id, question_index)
+        answer_ref = self.db.collection("answers").document(answer_id)
+        interview_ref = self.db.collection("interviews").document(interview_id)
+        
+        answer_data.update({
+            "id": answer_id,
+            "interview_id": interview_id,
+            "question_index": question_index,
+            "created_at": datetime.utcnow()
+        })
+        interview_update['updated_at'] = datetime.utcnow()
+        
+        batch = self.db.batch()
+        batch.create(answer_ref, answer_data)
+        batch.update(interview_ref, interview_update)
+        
+        try:
+            await batch.commit()
+        except AlreadyExists:
+            return None
+        finally:
+            self.invalidate("interviews", interview_id)
+        
+        return answer_id
     
     # Company Operations
     async def get_company_interviews(self, company_id: str) -> List[Dict]:
@@ -98,14 +608,16 @@ class FirebaseService:
             filters=[("company_id", "==", company_id)]
         )
     
-    async def get_interview_evaluation(self, interview_id: str) -> Optional[Dict]:
-        """Get evaluation for an interview"""
-        evaluations = await self.query_documents(
-            "evaluations",
-            filters=[("interview_id", "==", interview_id)],
-            limit=1
+    async def get_interview_question(self, interview_id: str, order: int) -> Optional[Dict]:
+        """Get a single interview question by its position"""
+        return await self.get_document(
+            "questions",
+            question_document_id(interview_id, order)
         )
-        return evaluations[0] if evaluations else None
+    
+    async def get_interview_evaluation(self, interview_id: str) -> Optional[Dict]:
+        """Get evaluation for an interview (stored under the interview ID)"""
+        return await self.get_document("evaluations", interview_id)
 
 
 # Global instance
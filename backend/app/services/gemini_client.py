@@ -0,0 +1,101 @@
+from typing import Any, Dict, Optional
+import asyncio
+import time
+
+
+class GeminiClient:
+    """
+    Async wrapper around a Gemini model.
+
+    All calls share one global concurrency limit so a burst of interviews
+    queues here instead of flooding the API, and every call is bounded by
+    a timeout. The Gemini SDK is imported and configured on first use.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        max_concurrency: int,
+        timeout: float,
+        api_key: Optional[str] = None
+    ):
+        self.model_name = model_name
+        self.api_key = api_key
+        self._model = None
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+        # Metrics
+        self._waiting = 0
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._timed_out = 0
+        self._total_latency = 0.0
+
+    @property
+    def model(self) -> Any:
+        if self._model is None:
+            import google.generativeai as genai
+
+            if self.api_key:
+                genai.configure(api_key=self.api_key)
+            self._model = genai.GenerativeModel(self.model_name)
+        return self._model
+
+    @model.setter
+    def model(self, model: Any) -> None:
+        self._model = model
+
+    async def generate(self, prompt: str, timeout: Optional[float] = None) -> str:
+        """
+        Generate a completion for the prompt
+
+        Args:
+            prompt: Prompt text
+            timeout: Per-call timeout in seconds (defaults to the client timeout)
+
+        Returns:
+            Response text
+        """
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        self._in_flight += 1
+        started = time.monotonic()
+        try:
+            response = await asyncio.wait_for(
+                self.model.generate_content_async(prompt),
+                timeout=timeout or self.timeout
+            )
+            text = response.text
+            self._completed += 1
+            self._total_latency += time.monotonic() - started
+            return text
+        except asyncio.TimeoutError:
+            self._timed_out += 1
+            raise
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            self._in_flight -= 1
+            self._semaphore.release()
+
+    def metrics(self) -> Dict:
+        """Current queue depth and call counters"""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "queue_depth": self._waiting,
+            "in_flight": self._in_flight,
+            "completed": self._completed,
+            "failed": self._failed,
+            "timed_out": self._timed_out,
+            "avg_latency_seconds": round(
+                self._total_latency / self._completed, 3
+            ) if self._completed else 0.0
+        }
@@ -1,19 +1,36 @@
-import google.generativeai as genai
 from app.core.config import settings
-from typing import Dict, List
+from app.services.gemini_client import GeminiClient
+from typing import Dict, List, Optional
+import asyncio
 import json
 
 
+EVALUATION_FIELDS = (
+    "accuracy",
+    "relevance",
+    "communication",
+    "clarity",
+    "confidence",
+    "feedback"
+)
+
+
 class GeminiService:
     def __init__(self):
-        genai.configure(api_key=settings.GEMINI_API_KEY)
-        self.model = genai.GenerativeModel(settings.GEMINI_MODEL)
+        self.client = GeminiClient(
+            settings.GEMINI_MODEL,
+            max_concurrency=settings.GEMINI_MAX_CONCURRENCY,
+            timeout=settings.GEMINI_TIMEOUT_SECONDS,
+            api_key=settings.GEMINI_API_KEY
+        )
     
     async def generate_text(self, prompt: str) -> str:
         """Generate text response from Gemini"""
         try:
-            response = self.model.generate_content(prompt)
-            return response.text
+            return await self.client.generate(prompt)
+        except asyncio.TimeoutError:
+            print(f"Gemini call timed out after {self.client.timeout}s")
+            raise
         except Exception as e:
             print(f"Error generating text: {e}")
             raise
@@ -118,6 +135,137 @@ class GeminiService:
             print(f"Error parsing evaluation JSON: {e}")
             raise
     
+    async def evaluate_answers_batch(self, items: List[Dict]) -> List[Optional[Dict]]:
+        """
+        Evaluate several answers in a single request
+        
+        Args:
+            items: Dicts with question, answer and expected_keywords
+            
+        Returns:
+            Evaluations in the same order as items; items the batch response
+            omits or gets wrong are evaluated individually, and None marks
+            items that failed both ways
+        """
+        
+        if len(items) == 1:
+            return list(await self._evaluate_individually(items))
+        
+        answers_block = "\n".join(
+            f"""
+        [{idx}]
+        Question: {item["question"]}
+        Expected Keywords: {', '.join(item["expected_keywords"])}
+        Candidate's Answer: {item["answer"]}"""
+            for idx, item in enumerate(items)
+        )
+        
+        prompt = f"""
+        Evaluate each of these {len(items)} interview answers on a scale of 0-10 for each criterion.
+        {answers_block}
+        
+        Evaluate based on:
+        1. Accuracy: How correct is the answer?
+        2. Relevance: How relevant is the answer to the question?
+        3. Communication: How well is the answer communicated?
+        4. Clarity: How clear and structured is the answer?
+        5. Confidence: How confident does the answer seem?
+        
+        Return ONLY a JSON array with one object per answer, using the number
+        in brackets as "index", with this exact structure:
+        [
+            {{
+                "index": 0,
+                "accuracy": 7.5,
+                "relevance": 8.0,
+                "communication": 7.0,
+                "clarity": 8.5,
+                "confidence": 7.5,
+                "feedback": "Detailed feedback explaining the scores"
+            }}
+        ]
+        """
+        
+        results: List[Optional[Dict]] = [None] * len(items)
+        
+        try:
+            parsed = self._parse_json(await self.generate_text(prompt))
+        except Exception as e:
+            print(f"Batch evaluation failed, evaluating individually: {e}")
+            parsed = []
+        
+        if isinstance(parsed, list):
+            for entry in parsed:
+                if not isinstance(entry, dict):
+                    continue
+                idx = entry.get("index")
+                if (
+                    isinstance(idx, int)
+                    and 0 <= idx < len(items)
+                    and results[idx] is None
+                    and self._is_valid_evaluation(entry)
+                ):
+                    results[idx] = {
+                        key: entry[key] for key in EVALUATION_FIELDS
+                    }
+        
+        # Fall back to the single-item path for anything the batch missed
+        missing = [idx for idx, result in enumerate(results) if result is None]
+        
+        if missing:
+            fallback = await self._evaluate_individually(
+                [items[idx] for idx in missing]
+            )
+            for idx, result in zip(missing, fallback):
+                results[idx] = result
+        
+        return results
+    
+    async def _evaluate_individually(self, items: List[Dict]) -> List[Optional[Dict]]:
+        """Evaluate items one request each, None for failures"""
+        
+        results = await asyncio.gather(
+            *(self.evaluate_answer(**item) for item in items),
+            return_exceptions=True
+        )
+        
+        evaluations = []
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"Error evaluating answer: {result}")
+                evaluations.append(None)
+            else:
+                evaluations.append(result)
+        
+        return evaluations
+    
+    @staticmethod
+    def _is_valid_evaluation(entry: Dict) -> bool:
+        """Check an evaluation has every criterion as a 0-10 number and feedback"""
+        
+        for criterion in EVALUATION_FIELDS[:-1]:
+            value = entry.get(criterion)
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                return False
+            if not 0 <= value <= 10:
+                return False
+        
+        return isinstance(entry.get("feedback"), str)
+    
+    @staticmethod
+    def _parse_json(response_text: str):
+        """Parse JSON from a response, stripping markdown code fences"""
+        
+        cleaned = response_text.strip()
+        if cleaned.startswith("```json"):
+            cleaned = cleaned[7:]
+        if cleaned.startswith("```"):
+            cleaned = cleaned[3:]
+        if cleaned.endswith("```"):
+            cleaned = cleaned[:-3]
+        
+        return json.loads(cleaned.strip())
+    
     async def generate_final_report(
         self,
         candidate_name: str,
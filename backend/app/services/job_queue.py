@@ -0,0 +1,318 @@
+from app.services.firebase_service import firebase_service
+from app.services.job_store import SQLiteJobStore
+from app.core.config import settings
+from app.utils.constants import COLLECTIONS, JobStatus, JobType
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+from datetime import datetime
+import asyncio
+import os
+import uuid
+
+
+JobHandler = Callable[[Dict], Awaitable[None]]
+
+
+class JobQueue:
+    """
+    Durable background job queue processed by in-process worker tasks.
+
+    Jobs live in a local SQLite file and are leased by workers, so work
+    in flight when the process dies is picked up again after a restart.
+    Failures are retried with exponential backoff and dead-lettered
+    (status failed) once JOB_MAX_ATTEMPTS is exhausted. Job state is
+    mirrored to the jobs collection under "{job_type}:{key}" so any
+    request can report it.
+    
+    Jobs are claimed highest priority first. On top of the general
+    workers, priority workers only take jobs with priority > 0, so a
+    backlog of background scoring never delays work a user is waiting on.
+    """
+
+    def __init__(
+        self,
+        store: SQLiteJobStore,
+        workers: int,
+        priority_workers: int,
+        max_attempts: int,
+        retry_delay: float,
+        lease_seconds: float,
+        poll_interval: float
+    ):
+        self.store = store
+        self.workers = workers
+        self.priority_workers = priority_workers
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._handlers: Dict[str, JobHandler] = {}
+        self._unmirrored: Set[str] = set()
+        self._priorities: Dict[str, int] = {}
+        self._wakeup = asyncio.Event()
+        self._finished: Dict[str, asyncio.Event] = {}
+        self._tasks: List[asyncio.Task] = []
+
+    def register(
+        self,
+        job_type: str,
+        handler: JobHandler,
+        mirror: bool = True,
+        priority: int = 0
+    ) -> None:
+        """
+        Register the coroutine that processes jobs of a type
+
+        Args:
+            job_type: Job type name
+            handler: Coroutine called with the job payload
+            mirror: Mirror job state to Firestore (skip for high-volume
+                jobs nobody reports on)
+            priority: Higher runs first; > 0 also runs on priority workers
+        """
+        self._handlers[job_type] = handler
+        self._priorities[JobType(job_type)] = priority
+        if not mirror:
+            self._unmirrored.add(JobType(job_type))
+
+    @staticmethod
+    def job_id(job_type: str, key: str) -> str:
+        # .value, since formatting a str Enum member gives "JobType.EVALUATION"
+        return f"{JobType(job_type).value}:{key}"
+
+    async def enqueue(self, job_type: str, key: str, payload: Dict) -> str:
+        """
+        Queue a job unless one for the same key is already pending
+
+        Args:
+            job_type: Registered job type
+            key: Unique key for the job (e.g. interview ID)
+            payload: JSON-serializable arguments passed to the handler
+
+        Returns:
+            Job ID
+        """
+        if job_type not in self._handlers:
+            raise ValueError(f"No handler registered for job type '{job_type}'")
+
+        job_id = self.job_id(job_type, key)
+        added = await asyncio.to_thread(
+            self.store.add, job_id, job_type, key, payload,
+            self._priorities[JobType(job_type)]
+        )
+
+        if added:
+            await self._mirror(job_type, job_id, {
+                "job_type": job_type,
+                "key": key,
+                "status": JobStatus.QUEUED,
+                "attempts": 0,
+                "error": None,
+                "created_at": datetime.utcnow()
+            }, create=True)
+            self._wakeup.set()
+
+        return job_id
+
+    async def get_job(self, job_type: str, key: str) -> Optional[Dict]:
+        """Get the state of a job (local store first, then the mirror)"""
+        job_id = self.job_id(job_type, key)
+        job = await asyncio.to_thread(self.store.get, job_id)
+
+        if job:
+            return job
+
+        return await firebase_service.get_document(COLLECTIONS["JOBS"], job_id)
+
+    async def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Dict]:
+        """
+        Wait until a job is done or dead-lettered
+
+        Returns:
+            Final job state, or the current state if the timeout expires
+        """
+        event = self._finished.setdefault(job_id, asyncio.Event())
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout is not None else None
+
+        try:
+            while True:
+                job = await asyncio.to_thread(self.store.get, job_id)
+                if job is None or job["status"] in (JobStatus.DONE, JobStatus.FAILED):
+                    return job
+
+                wait_for = self.poll_interval
+                if deadline is not None:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        return job
+                    wait_for = min(wait_for, remaining)
+
+                # Woken early when a local worker finishes the job; polling
+                # covers jobs finished by another process sharing the file
+                try:
+                    await asyncio.wait_for(event.wait(), timeout=wait_for)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._finished.pop(job_id, None)
+
+    async def dead_letters(self, limit: int = 100) -> List[Dict]:
+        """List jobs that exhausted their attempts"""
+        return await asyncio.to_thread(self.store.dead_letters, limit)
+
+    async def requeue(self, job_id: str) -> bool:
+        """Retry a dead-lettered job from scratch"""
+        requeued = await asyncio.to_thread(self.store.requeue, job_id)
+        if requeued:
+            job = await asyncio.to_thread(self.store.get, job_id)
+            await self._mirror(job["job_type"], job_id, {
+                "status": JobStatus.QUEUED,
+                "attempts": 0
+            })
+            self._wakeup.set()
+        return requeued
+
+    async def start(self) -> None:
+        """Start worker tasks"""
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._worker(min_priority=0))
+            for _ in range(self.workers)
+        ] + [
+            asyncio.create_task(self._worker(min_priority=1))
+            for _ in range(self.priority_workers)
+        ]
+
+    async def stop(self) -> None:
+        """Cancel worker tasks and hand their leased jobs back to the queue"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        await asyncio.to_thread(self.store.release, self.owner)
+        self.store.close()
+
+    async def _worker(self, min_priority: int) -> None:
+        while True:
+            try:
+                job = await asyncio.to_thread(
+                    self.store.claim, self.owner, self.lease_seconds, min_priority
+                )
+            except Exception as e:
+                print(f"Job worker error: {e}")
+                job = None
+
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(),
+                        timeout=self.poll_interval
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            try:
+                await self._run(job)
+            except Exception as e:
+                print(f"Job worker error: {e}")
+
+    async def _heartbeat(self, job_id: str) -> None:
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            await asyncio.to_thread(
+                self.store.extend_lease, job_id, self.owner, self.lease_seconds
+            )
+
+    async def _run(self, job: Dict) -> None:
+        job_id = job["id"]
+
+        # A lease that expired too many times (e.g. repeated crashes)
+        if job["attempts"] > self.max_attempts:
+            await self._dead_letter(job, job.get("error") or "Lease expired")
+            return
+
+        await self._mirror(job["job_type"], job_id, {
+            "status": JobStatus.RUNNING,
+            "attempts": job["attempts"],
+            "started_at": datetime.utcnow()
+        })
+
+        heartbeat = asyncio.create_task(self._heartbeat(job_id))
+        try:
+            await self._handlers[job["job_type"]](job["payload"])
+        except Exception as e:
+            print(f"Job {job_id} failed (attempt {job['attempts']}): {e}")
+
+            if job["attempts"] < self.max_attempts:
+                delay = self.retry_delay * 2 ** (job["attempts"] - 1)
+                await asyncio.to_thread(
+                    self.store.retry, job_id, self.owner, str(e), delay
+                )
+                await self._mirror(job["job_type"], job_id, {
+                    "status": JobStatus.QUEUED,
+                    "error": str(e)
+                })
+            else:
+                await self._dead_letter(job, str(e))
+            return
+        finally:
+            heartbeat.cancel()
+
+        await asyncio.to_thread(self.store.complete, job_id, self.owner)
+        await self._mirror(job["job_type"], job_id, {
+            "status": JobStatus.DONE,
+            "error": None,
+            "finished_at": datetime.utcnow()
+        })
+        self._notify(job_id)
+
+    async def _dead_letter(self, job: Dict, error: str) -> None:
+        await asyncio.to_thread(self.store.dead_letter, job["id"], self.owner, error)
+        await self._mirror(job["job_type"], job["id"], {
+            "status": JobStatus.FAILED,
+            "error": error,
+            "finished_at": datetime.utcnow()
+        })
+        self._notify(job["id"])
+
+    def _notify(self, job_id: str) -> None:
+        event = self._finished.get(job_id)
+        if event:
+            event.set()
+
+    async def _mirror(
+        self,
+        job_type: str,
+        job_id: str,
+        data: Dict,
+        create: bool = False
+    ) -> None:
+        """Best-effort copy of job state to Firestore"""
+        if JobType(job_type) in self._unmirrored:
+            return
+
+        try:
+            await firebase_service.set_document(
+                COLLECTIONS["JOBS"],
+                job_id,
+                data,
+                merge=not create
+            )
+        except Exception as e:
+            print(f"Failed to mirror job {job_id} state: {e}")
+
+
+# Global instance
+job_queue = JobQueue(
+    store=SQLiteJobStore(settings.JOB_QUEUE_PATH),
+    workers=settings.JOB_WORKERS,
+    priority_workers=settings.JOB_PRIORITY_WORKERS,
+    max_attempts=settings.JOB_MAX_ATTEMPTS,
+    retry_delay=settings.JOB_RETRY_DELAY_SECONDS,
+    lease_seconds=settings.JOB_LEASE_SECONDS,
+    poll_interval=settings.JOB_POLL_INTERVAL_SECONDS
+)
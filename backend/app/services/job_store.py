@@ -0,0 +1,266 @@
+from app.utils.constants import JobStatus
+from typing import Dict, List, Optional
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+class SQLiteJobStore:
+    """
+    Durable, file-backed job table.
+
+    Jobs are claimed under a lease; a job whose lease expires (e.g. the
+    process died mid-run) becomes claimable again, so work is resumed
+    after a restart instead of being lost. All methods are blocking and
+    meant to be called through asyncio.to_thread.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+
+            conn = sqlite3.connect(
+                self.path,
+                check_same_thread=False,
+                isolation_level=None
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    job_type TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    available_at REAL NOT NULL,
+                    lease_owner TEXT,
+                    lease_expires_at REAL,
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    priority INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            # Files created before jobs had priorities
+            columns = [row["name"] for row in conn.execute("PRAGMA table_info(jobs)")]
+            if "priority" not in columns:
+                conn.execute(
+                    "ALTER TABLE jobs ADD COLUMN priority INTEGER NOT NULL DEFAULT 0"
+                )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_jobs_ready "
+                "ON jobs (status, available_at)"
+            )
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict:
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        return job
+
+    def add(
+        self,
+        job_id: str,
+        job_type: str,
+        key: str,
+        payload: Dict,
+        priority: int = 0
+    ) -> bool:
+        """
+        Insert a queued job (higher priority jobs are claimed first)
+
+        Returns:
+            False if a queued or running job with the same ID already exists
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT status FROM jobs WHERE id = ?", (job_id,)
+                ).fetchone()
+
+                if row and row["status"] in (JobStatus.QUEUED, JobStatus.RUNNING):
+                    conn.execute("COMMIT")
+                    return False
+
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO jobs (
+                        id, job_type, key, payload, status, attempts,
+                        available_at, created_at, updated_at, priority
+                    ) VALUES (?, ?, ?, ?, ?, 0, ?, ?, ?, ?)
+                    """,
+                    (job_id, job_type, key, json.dumps(payload),
+                     JobStatus.QUEUED.value, now, now, now, priority)
+                )
+                conn.execute("COMMIT")
+                return True
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def claim(
+        self,
+        owner: str,
+        lease_seconds: float,
+        min_priority: int = 0
+    ) -> Optional[Dict]:
+        """
+        Lease the next ready job, including jobs whose lease expired
+        
+        Jobs are taken highest priority first, then oldest first; jobs
+        below min_priority are left for other workers.
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    """
+                    SELECT id FROM jobs
+                    WHERE ((status = ? AND available_at <= ?)
+                        OR (status = ? AND lease_expires_at <= ?))
+                      AND priority >= ?
+                    ORDER BY priority DESC, available_at
+                    LIMIT 1
+                    """,
+                    (JobStatus.QUEUED.value, now, JobStatus.RUNNING.value, now,
+                     min_priority)
+                ).fetchone()
+
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+
+                conn.execute(
+                    """
+                    UPDATE jobs
+                    SET status = ?, attempts = attempts + 1, lease_owner = ?,
+                        lease_expires_at = ?, updated_at = ?
+                    WHERE id = ?
+                    """,
+                    (JobStatus.RUNNING.value, owner, now + lease_seconds,
+                     now, row["id"])
+                )
+                job = conn.execute(
+                    "SELECT * FROM jobs WHERE id = ?", (row["id"],)
+                ).fetchone()
+                conn.execute("COMMIT")
+                return self._to_dict(job)
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def extend_lease(self, job_id: str, owner: str, lease_seconds: float) -> bool:
+        """Renew a lease held by owner"""
+        now = time.time()
+        with self._lock:
+            cursor = self._connect().execute(
+                """
+                UPDATE jobs SET lease_expires_at = ?, updated_at = ?
+                WHERE id = ? AND lease_owner = ? AND status = ?
+                """,
+                (now + lease_seconds, now, job_id, owner, JobStatus.RUNNING.value)
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, job_id: str, owner: str) -> None:
+        """Mark a leased job as done"""
+        self._finish(job_id, owner, JobStatus.DONE, None, None)
+
+    def retry(self, job_id: str, owner: str, error: str, delay: float) -> None:
+        """Release a leased job back to the queue after a delay"""
+        self._finish(job_id, owner, JobStatus.QUEUED, error, time.time() + delay)
+
+    def dead_letter(self, job_id: str, owner: Optional[str], error: str) -> None:
+        """Park a job that exhausted its attempts"""
+        self._finish(job_id, owner, JobStatus.FAILED, error, None)
+
+    def _finish(
+        self,
+        job_id: str,
+        owner: Optional[str],
+        status: JobStatus,
+        error: Optional[str],
+        available_at: Optional[float]
+    ) -> None:
+        now = time.time()
+        with self._lock:
+            self._connect().execute(
+                """
+                UPDATE jobs
+                SET status = ?, error = ?, lease_owner = NULL,
+                    lease_expires_at = NULL,
+                    available_at = COALESCE(?, available_at), updated_at = ?
+                WHERE id = ? AND (? IS NULL OR lease_owner = ?)
+                """,
+                (status.value, error, available_at, now, job_id, owner, owner)
+            )
+
+    def release(self, owner: str) -> int:
+        """Return every job leased by owner to the queue (graceful shutdown)"""
+        now = time.time()
+        with self._lock:
+            cursor = self._connect().execute(
+                """
+                UPDATE jobs SET status = ?, lease_owner = NULL,
+                    lease_expires_at = NULL, attempts = attempts - 1,
+                    available_at = ?, updated_at = ?
+                WHERE lease_owner = ? AND status = ?
+                """,
+                (JobStatus.QUEUED.value, now, now, owner, JobStatus.RUNNING.value)
+            )
+            return cursor.rowcount
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Get a job by ID"""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT * FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._to_dict(row) if row else None
+
+    def dead_letters(self, limit: int = 100) -> List[Dict]:
+        """List jobs that exhausted their attempts"""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT * FROM jobs WHERE status = ? ORDER BY updated_at DESC LIMIT ?",
+                (JobStatus.FAILED.value, limit)
+            ).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def requeue(self, job_id: str) -> bool:
+        """Move a dead-lettered job back to the queue with fresh attempts"""
+        now = time.time()
+        with self._lock:
+            cursor = self._connect().execute(
+                """
+                UPDATE jobs SET status = ?, attempts = 0, error = NULL,
+                    available_at = ?, updated_at = ?
+                WHERE id = ? AND status = ?
+                """,
+                (JobStatus.QUEUED.value, now, now, job_id, JobStatus.FAILED.value)
+            )
+            return cursor.rowcount == 1
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -1,17 +1,29 @@
 from app.services.gemini_service import gemini_service
 from app.services.firebase_service import firebase_service
+from app.services.job_queue import job_queue
+from app.core.config import settings
+from app.utils.cache import TTLCache
+from app.utils.helpers import question_document_id
 from app.utils.constants import (
     InterviewRound, 
+    JobType,
     TECHNICAL_QUESTIONS_COUNT, 
     HR_QUESTIONS_COUNT,
     COLLECTIONS
 )
-from typing import List, Dict
-import uuid
+from typing import List, Dict, Optional
+import asyncio
 
 
 class QuestionGeneratorService:
     
+    def __init__(self):
+        # Ordered questions per interview; questions never change once saved
+        self._cache = TTLCache(
+            maxsize=settings.QUESTION_CACHE_SIZE,
+            ttl=settings.QUESTION_CACHE_TTL_SECONDS
+        )
+    
     async def generate_interview_questions(
         self,
         interview_id: str,
@@ -20,77 +32,122 @@ class QuestionGeneratorService:
     ) -> List[Dict]:
         """Generate all questions for an interview"""
         
+        # Generate both rounds concurrently
+        technical_questions, hr_questions = await asyncio.gather(
+            gemini_service.generate_questions(
+                job_role=job_role,
+                skills=candidate_skills,
+                round_type=InterviewRound.TECHNICAL,
+                count=TECHNICAL_QUESTIONS_COUNT
+            ),
+            gemini_service.generate_questions(
+                job_role=job_role,
+                skills=["communication", "teamwork", "problem-solving"],
+                round_type=InterviewRound.HR,
+                count=HR_QUESTIONS_COUNT
+            )
+        )
+        
         all_questions = []
         
-        # Generate Technical Questions
-        technical_questions = await gemini_service.generate_questions(
-            job_role=job_role,
-            skills=candidate_skills,
-            round_type=InterviewRound.TECHNICAL,
-            count=TECHNICAL_QUESTIONS_COUNT
-        )
+        # Technical questions come first, then HR
+        rounds = [
+            (InterviewRound.TECHNICAL, technical_questions, 0),
+            (InterviewRound.HR, hr_questions, TECHNICAL_QUESTIONS_COUNT)
+        ]
         
-        # Save technical questions
-        for idx, q in enumerate(technical_questions):
-            question_data = {
-                "id": str(uuid.uuid4()),
-                "interview_id": interview_id,
-                "question_text": q["question"],
-                "round_type": InterviewRound.TECHNICAL,
-                "difficulty": q["difficulty"],
-                "expected_keywords": q["expected_keywords"],
-                "order": idx
-            }
-            await firebase_service.create_document(
-                COLLECTIONS["QUESTIONS"],
-                question_data
-            )
-            all_questions.append(question_data)
-        
-        # Generate HR Questions
-        hr_questions = await gemini_service.generate_questions(
-            job_role=job_role,
-            skills=["communication", "teamwork", "problem-solving"],
-            round_type=InterviewRound.HR,
-            count=HR_QUESTIONS_COUNT
+        for round_type, questions, offset in rounds:
+            for idx, q in enumerate(questions):
+                all_questions.append({
+                    "id": question_document_id(interview_id, idx + offset),
+                    "interview_id": interview_id,
+                    "question_text": q["question"],
+                    "round_type": round_type,
+                    "difficulty": q["difficulty"],
+                    "expected_keywords": q["expected_keywords"],
+                    "order": idx + offset
+                })
+        
+        # Save all questions in a single batched write
+        await firebase_service.create_documents(
+            COLLECTIONS["QUESTIONS"],
+            all_questions
         )
         
-        # Save HR questions
-        for idx, q in enumerate(hr_questions):
-            question_data = {
-                "id": str(uuid.uuid4()),
-                "interview_id": interview_id,
-                "question_text": q["question"],
-                "round_type": InterviewRound.HR,
-                "difficulty": q["difficulty"],
-                "expected_keywords": q["expected_keywords"],
-                "order": idx + TECHNICAL_QUESTIONS_COUNT
-            }
-            await firebase_service.create_document(
-                COLLECTIONS["QUESTIONS"],
-                question_data
-            )
-            all_questions.append(question_data)
+        self._cache.set(interview_id, list(all_questions))
         
         return all_questions
     
+    async def _ordered_questions(self, interview_id: str) -> List[Dict]:
+        """Cached, order-sorted questions (shared; callers must copy)"""
+        
+        questions = self._cache.get(interview_id)
+        
+        if questions is None:
+            questions = await firebase_service.get_interview_questions(interview_id)
+            
+            # Sort by order
+            questions.sort(key=lambda x: x.get("order", 0))
+            
+            # An empty list may just mean generation is still running
+            if questions:
+                self._cache.set(interview_id, questions)
+        
+        return questions
+    
+    async def get_interview_questions(self, interview_id: str) -> List[Dict]:
+        """Get all questions for an interview, sorted by order"""
+        
+        questions = await self._ordered_questions(interview_id)
+        return [dict(q) for q in questions]
+    
     async def get_next_question(
         self,
         interview_id: str,
         current_index: int
-    ) -> Dict:
+    ) -> Optional[Dict]:
         """Get the next question for an interview"""
         
-        questions = await firebase_service.get_interview_questions(interview_id)
+        questions = self._cache.get(interview_id)
         
-        # Sort by order
-        questions.sort(key=lambda x: x.get("order", 0))
+        # Cache miss: a single point read by deterministic ID
+        if questions is None:
+            return await firebase_service.get_interview_question(
+                interview_id,
+                current_index
+            )
         
         if current_index < len(questions):
-            return questions[current_index]
+            return dict(questions[current_index])
         
         return None
+    
+    def invalidate_questions(self, interview_id: str) -> None:
+        """Drop cached questions for an interview"""
+        self._cache.delete(interview_id)
+    
+    async def run_question_generation_job(self, payload: Dict) -> None:
+        """Job handler: generate questions unless a previous run saved them"""
+        
+        interview_id = payload["interview_id"]
+        # Questions are saved in one atomic batch, so a partial set cannot
+        # exist and the first question tells whether a previous run finished
+        if await firebase_service.get_interview_question(interview_id, 0):
+            return
+        
+        await self.generate_interview_questions(
+            interview_id=interview_id,
+            job_role=payload["job_role"],
+            candidate_skills=payload["candidate_skills"]
+        )
 
 
 # Global instance
-question_generator = QuestionGeneratorService()
\ No newline at end of file
+question_generator = QuestionGeneratorService()
+
+job_queue.register(
+    JobType.QUESTION_GENERATION,
+    question_generator.run_question_generation_job,
+    mirror=False,
+    priority=2
+)
\ No newline at end of file
@@ -1,13 +1,21 @@
 from app.core.firebase import firebase_conn
+import asyncio
 import base64
-from typing import Optional
+from typing import AsyncIterator, Optional
 from datetime import timedelta
 import uuid
 
 
+# Bytes sent per resumable upload request (must be a multiple of 256 KB)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
 class StorageService:
-    def __init__(self):
-        self.bucket = firebase_conn.bucket
+    
+    @property
+    def bucket(self):
+        """Shared storage bucket, connected on first use"""
+        return firebase_conn.bucket
     
     async def upload_file(
         self, 
@@ -57,6 +65,83 @@ class StorageService:
             folder=f"interviews/{interview_id}/audio"
         )
     
+    def audio_blob_name(self, interview_id: str, question_id: str, upload_id: str) -> str:
+        """
+        Storage path of a streamed answer recording
+        
+        Each upload attempt gets its own object, so a retry or a late upload
+        never overwrites the audio of an answer that was already recorded.
+        """
+        return f"interviews/{interview_id}/audio/answer_{question_id}_{upload_id}.webm"
+    
+    async def upload_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        blob_name: str,
+        content_type: str,
+        max_bytes: int
+    ) -> Optional[str]:
+        """
+        Pipe a byte stream to storage through a resumable upload
+        
+        At most UPLOAD_CHUNK_SIZE bytes are buffered before being sent, so
+        memory per upload stays constant whatever the file size. If the
+        upload fails part way (or the client disconnects), the resumable
+        session is cancelled so no partial data is left behind.
+        
+        Returns:
+            Public URL, or None if the stream was empty (nothing is stored)
+        
+        Raises:
+            ValueError: If the stream exceeds max_bytes
+        """
+        blob = self.bucket.blob(blob_name)
+        writer = blob.open("wb", content_type=content_type, chunk_size=UPLOAD_CHUNK_SIZE)
+        
+        buffer = bytearray()
+        total = 0
+        
+        try:
+            async for chunk in chunks:
+                total += len(chunk)
+                if total > max_bytes:
+                    raise ValueError(f"Upload exceeds {max_bytes} bytes")
+                
+                buffer.extend(chunk)
+                if len(buffer) >= UPLOAD_CHUNK_SIZE:
+                    await asyncio.to_thread(writer.write, bytes(buffer))
+                    buffer.clear()
+            
+            if buffer:
+                await asyncio.to_thread(writer.write, bytes(buffer))
+        except BaseException:
+            await self._terminate(writer)
+            raise
+        
+        if not total:
+            await self._terminate(writer)
+            return None
+        
+        await asyncio.to_thread(writer.close)
+        await asyncio.to_thread(blob.make_public)
+        
+        return blob.public_url
+    
+    async def _terminate(self, writer) -> None:
+        """Cancel a resumable upload session (best effort)"""
+        try:
+            await asyncio.to_thread(writer.terminate)
+        except Exception as e:
+            print(f"Error cancelling upload: {str(e)}")
+    
+    async def get_public_url(self, blob_name: str) -> Optional[str]:
+        """Public URL of a blob, or None if it doesn't exist"""
+        blob = self.bucket.blob(blob_name)
+        
+        if not await asyncio.to_thread(blob.exists):
+            return None
+        return blob.public_url
+    
     async def upload_video_chunk(
         self,
         video_data: bytes,
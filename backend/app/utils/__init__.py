@@ -4,6 +4,8 @@ from app.utils.constants import (
     InterviewRound,
     QuestionDifficulty,
     EvaluationCriteria,
+    JobStatus,
+    JobType,
     COLLECTIONS,
     TECHNICAL_QUESTIONS_COUNT,
     HR_QUESTIONS_COUNT,
@@ -18,6 +20,8 @@ __all__ = [
     "InterviewRound",
     "QuestionDifficulty",
     "EvaluationCriteria",
+    "JobStatus",
+    "JobType",
     "COLLECTIONS",
     "TECHNICAL_QUESTIONS_COUNT",
     "HR_QUESTIONS_COUNT",
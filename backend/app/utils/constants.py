@@ -25,6 +25,19 @@ class QuestionDifficulty(str, Enum):
     HARD = "hard"
 
 
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class JobType(str, Enum):
+    EVALUATION = "evaluation"
+    ANSWER_EVALUATION = "answer_evaluation"
+    QUESTION_GENERATION = "question_generation"
+
+
 class EvaluationCriteria(str, Enum):
     ACCURACY = "accuracy"
     RELEVANCE = "relevance"
@@ -41,7 +54,9 @@ COLLECTIONS = {
     "QUESTIONS": "questions",
     "EVALUATIONS": "evaluations",
     "RESUMES": "resumes",
-    "RECORDINGS": "recordings"
+    "RECORDINGS": "recordings",
+    "JOBS": "jobs",
+    "EVALUATION_LEASES": "evaluation_leases"
 }
 
 
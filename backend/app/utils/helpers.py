@@ -107,4 +107,21 @@ def mask_email(email: str) -> str:
             masked_username = username[0] + '*' * (len(username) - 2) + username[-1]
         return f"{masked_username}@{domain}"
     except:
-        return email
\ No newline at end of file
+        return email
+
+
+def question_document_id(interview_id: str, order: int) -> str:
+    """Deterministic question document ID (e.g. "abc123:4")"""
+    return f"{interview_id}:{order}"
+
+
+def answer_document_id(interview_id: str, question_index: int) -> str:
+    """Deterministic answer document ID, one per question slot (e.g. "abc123:4")"""
+    return f"{interview_id}:{question_index}"
+
+
+def parse_csv(value: Optional[str]) -> list[str]:
+    """Split a comma-separated query value into trimmed, non-empty items"""
+    if not value:
+        return []
+    return [item.strip() for item in value.split(',') if item.strip()]
@@ -0,0 +1,72 @@
+from collections import OrderedDict, deque
+from typing import Hashable, Optional
+import threading
+import time
+
+
+class SlidingWindowLimiter:
+    """
+    Allow at most `limit` hits per key within a sliding `window` (seconds).
+
+    Keys are tracked LRU-style up to `maxsize`, so a flood of distinct
+    keys can't grow memory without bound.
+    """
+
+    def __init__(self, limit: int, window: float, maxsize: int = 10000):
+        self.limit = limit
+        self.window = window
+        self.maxsize = maxsize
+        self._hits: "OrderedDict[Hashable, deque]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, key: Hashable) -> float:
+        """
+        Record a hit for key if it is within the limit
+
+        Returns:
+            0 if the hit was admitted, otherwise seconds until the next
+            hit would be
+        """
+        if self.limit <= 0:
+            return 0.0
+
+        now = time.monotonic()
+        with self._lock:
+            hits = self._hits.get(key)
+            if hits is None:
+                hits = self._hits[key] = deque()
+            self._hits.move_to_end(key)
+
+            while hits and hits[0] <= now - self.window:
+                hits.popleft()
+
+            if len(hits) >= self.limit:
+                return hits[0] + self.window - now
+
+            hits.append(now)
+
+            while len(self._hits) > self.maxsize:
+                self._hits.popitem(last=False)
+
+            return 0.0
+
+
+def forwarded_client_ip(
+    forwarded_for: Optional[str],
+    peer: str,
+    trusted_hops: int
+) -> str:
+    """
+    Client address as seen by the outermost trusted proxy
+
+    Each proxy appends the address it received the request from to
+    X-Forwarded-For, so only the last trusted_hops entries are reliable;
+    anything left of them was sent by the client and is ignored.
+    """
+    if trusted_hops <= 0 or not forwarded_for:
+        return peer
+
+    hops = [hop.strip() for hop in forwarded_for.split(",") if hop.strip()]
+    if len(hops) < trusted_hops:
+        return peer
+    return hops[-trusted_hops]
@@ -0,0 +1,53 @@
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+import asyncio
+
+
+class _Call:
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.callers = 0
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into one.
+
+    While a call for a key is in flight, later callers await the same
+    task instead of starting their own, and all of them get its result
+    (or exception). Results are not kept once the call finishes.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Any, bool]:
+        """
+        Run fn, or join the in-flight call for key
+
+        Returns:
+            (result, shared) where shared is True if other callers received
+            the same result object (copy it before mutating)
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(self._run(key, fn)))
+            self._calls[key] = call
+
+        call.callers += 1
+        # Shielded so one caller being cancelled doesn't cancel the others
+        result = await asyncio.shield(call.task)
+        return result, call.callers > 1
+
+    async def _run(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            return await fn()
+        finally:
+            # Removed before the task completes, so nobody joins a finished call
+            self._calls.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._calls)
@@ -0,0 +1,74 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+import asyncio
+import time
+
+
+class PoolBusy(Exception):
+    """Raised when a WorkerPool's queue is full"""
+
+
+class WorkerPool:
+    """
+    Size-bounded thread pool for blocking, CPU-heavy calls.
+
+    At most `workers` calls run at once and at most `max_queue` more may
+    wait; beyond that calls are rejected with PoolBusy instead of piling
+    up, so a burst can't exhaust CPU or memory.
+    """
+
+    def __init__(self, workers: int, max_queue: int, name: str = "worker"):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix=name
+        )
+        self._semaphore = asyncio.Semaphore(workers)
+
+        # Metrics
+        self._waiting = 0
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_latency = 0.0
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run fn(*args) on the pool and await its result"""
+        if self._waiting >= self.max_queue:
+            self._rejected += 1
+            raise PoolBusy("Worker pool queue is full")
+
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        self._in_flight += 1
+        started = time.monotonic()
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._executor, fn, *args)
+            self._completed += 1
+            self._total_latency += time.monotonic() - started
+            return result
+        finally:
+            self._in_flight -= 1
+            self._semaphore.release()
+
+    def metrics(self) -> Dict:
+        """Current queue depth and call counters"""
+        return {
+            "workers": self.workers,
+            "queue_depth": self._waiting,
+            "in_flight": self._in_flight,
+            "completed": self._completed,
+            "rejected": self._rejected,
+            "avg_latency_seconds": round(
+                self._total_latency / self._completed, 3
+            ) if self._completed else 0.0
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,57 @@
+import time
+from app.utils.cache import TTLCache
+
+
+def test_get_and_set():
+    """Test basic caching"""
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("interview-1", ["q1", "q2"])
+    
+    assert cache.get("interview-1") == ["q1", "q2"]
+    assert cache.get("missing") is None
+
+
+def test_entries_expire():
+    """Test that entries expire after their TTL"""
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("short", "value", ttl=0.01)
+    cache.set("long", "value")
+    
+    time.sleep(0.02)
+    
+    assert cache.get("short") is None
+    assert cache.get("long") == "value"
+
+
+def test_lru_eviction():
+    """Test that the least recently used entry is evicted"""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_invalidation():
+    """Test explicit invalidation"""
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    
+    cache.delete("a")
+    assert cache.get("a") is None
+    
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_disabled_cache():
+    """Test that a zero TTL disables caching"""
+    cache = TTLCache(maxsize=10, ttl=0)
+    cache.set("a", 1)
+    
+    assert cache.get("a") is None
@@ -0,0 +1,125 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+# Settings are read at import time; these tests never reach Firestore or Gemini
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("FIREBASE_STORAGE_BUCKET", "test-bucket")
+os.environ.setdefault("GEMINI_API_KEY", "test-key")
+
+from tests.test_firebase_service import FakeDb, FakeFirebaseService
+from app.core.config import settings
+from app.services import evaluation_service as evaluation_module
+from app.services.evaluation_service import EvaluationService
+
+
+@pytest.fixture
+def leases(monkeypatch):
+    """Fake Firestore behind the evaluation service, with short timings"""
+    db = FakeDb()
+    db.release.set()
+    monkeypatch.setattr(evaluation_module, "firebase_service", FakeFirebaseService(db))
+    monkeypatch.setattr(settings, "EVALUATION_LEASE_SECONDS", 0.15)
+    monkeypatch.setattr(settings, "EVALUATION_WAIT_SECONDS", 1.0)
+    monkeypatch.setattr(settings, "JOB_POLL_INTERVAL_SECONDS", 0.01)
+    return db
+
+
+def make_service(generate_seconds=0.0):
+    service = EvaluationService()
+    service.generated = 0
+
+    async def generate(interview_id):
+        service.generated += 1
+        await asyncio.sleep(generate_seconds)
+        return {"interview_id": interview_id, "owner": service.owner}
+
+    service.generate_final_evaluation = generate
+    return service
+
+
+def hold_lease(db, owner, expires_in):
+    db.collections.setdefault("evaluation_leases", {})["i1"] = {
+        "id": "i1",
+        "owner": owner,
+        "expires_at": time.time() + expires_in
+    }
+    db.update_times[("evaluation_leases", "i1")] = 0
+
+
+def test_generates_and_releases_lease(leases):
+    """Test that a free lease is taken, used and released"""
+    service = make_service()
+
+    evaluation = asyncio.run(service.ensure_final_evaluation("i1"))
+
+    assert evaluation["owner"] == service.owner
+    assert service.generated == 1
+    assert "i1" not in leases.collections["evaluation_leases"]
+
+
+def test_waiter_takes_over_crashed_holders_lease(leases):
+    """Test that a waiter generates once a dead holder's lease expires"""
+    hold_lease(leases, "crashed", expires_in=0.1)
+    service = make_service()
+
+    evaluation = asyncio.run(service.ensure_final_evaluation("i1"))
+
+    assert evaluation["owner"] == service.owner
+    assert service.generated == 1
+
+
+def test_waiter_returns_the_holders_evaluation(leases):
+    """Test that a waiter picks up the evaluation the holder saves"""
+    hold_lease(leases, "other", expires_in=60)
+    service = make_service()
+
+    async def run():
+        waiter = asyncio.ensure_future(service.ensure_final_evaluation("i1"))
+        await asyncio.sleep(0.05)
+        leases.collections["evaluations"] = {"i1": {"id": "i1", "owner": "other"}}
+        return await waiter
+
+    assert asyncio.run(run())["owner"] == "other"
+    assert service.generated == 0
+
+
+def test_waiter_gives_up_after_wait_seconds(leases, monkeypatch):
+    """Test that a live holder's lease makes the waiter time out with None"""
+    monkeypatch.setattr(settings, "EVALUATION_WAIT_SECONDS", 0.1)
+    hold_lease(leases, "other", expires_in=60)
+    service = make_service()
+
+    assert asyncio.run(service.ensure_final_evaluation("i1")) is None
+    assert service.generated == 0
+
+
+def test_heartbeat_keeps_lease_through_long_generation(leases):
+    """Test that renewals stop others taking a lease held past its length"""
+    holder = make_service(generate_seconds=0.5)
+    contender = make_service()
+
+    async def run():
+        running = asyncio.ensure_future(holder.ensure_final_evaluation("i1"))
+        await asyncio.sleep(0.35)
+        # Well past EVALUATION_LEASE_SECONDS, but the holder kept renewing
+        taken = await evaluation_module.firebase_service.acquire_lease(
+            "evaluation_leases", "i1", contender.owner, 60
+        )
+        await running
+        return taken
+
+    assert asyncio.run(run()) is False
+    assert holder.generated == 1
+
+
+def test_heartbeat_stops_once_lease_is_lost(leases):
+    """Test that the renew loop ends when another owner holds the lease"""
+    service = make_service()
+    hold_lease(leases, "other", expires_in=60)
+
+    asyncio.run(asyncio.wait_for(service._renew_lease("i1"), timeout=1))
+
+    assert leases.collections["evaluation_leases"]["i1"]["owner"] == "other"
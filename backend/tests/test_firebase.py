@@ -0,0 +1,69 @@
+import asyncio
+import os
+
+# Settings are read at import time; these tests never reach Firebase
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("FIREBASE_STORAGE_BUCKET", "test-bucket")
+os.environ.setdefault("GEMINI_API_KEY", "test-key")
+
+from app.core.firebase import FirebaseConnection
+
+
+class FakeTransport:
+    def __init__(self, is_async):
+        self.is_async = is_async
+        self.closed = False
+
+    def close(self):
+        if not self.is_async:
+            self.closed = True
+            return None
+
+        async def close():
+            self.closed = True
+        return close()
+
+
+class FakeApi:
+    def __init__(self, transport):
+        self.transport = transport
+
+
+class FakeClient:
+    def __init__(self, transport=None):
+        self._firestore_api_internal = FakeApi(transport) if transport else None
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_close_closes_firestore_transports():
+    """Test that close() closes both clients' gRPC transports"""
+    conn = FirebaseConnection()
+    async_transport = FakeTransport(is_async=True)
+    sync_transport = FakeTransport(is_async=False)
+    async_db = FakeClient(async_transport)
+    db = FakeClient(sync_transport)
+    FirebaseConnection._async_db = async_db
+    FirebaseConnection._db = db
+
+    asyncio.run(conn.close())
+
+    assert async_transport.closed
+    assert sync_transport.closed
+    assert async_db.closed and db.closed
+    assert FirebaseConnection._async_db is None
+    assert FirebaseConnection._db is None
+
+
+def test_close_skips_clients_that_never_opened_a_channel():
+    """Test that close() doesn't need a transport for unused clients"""
+    conn = FirebaseConnection()
+    async_db = FakeClient()
+    FirebaseConnection._async_db = async_db
+
+    asyncio.run(conn.close())
+
+    assert async_db.closed
+    assert FirebaseConnection._async_db is None
@@ -0,0 +1,264 @@
+import asyncio
+import os
+
+# Settings are read at import time; these tests never reach Firestore
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("FIREBASE_STORAGE_BUCKET", "test-bucket")
+os.environ.setdefault("GEMINI_API_KEY", "test-key")
+
+from google.api_core.exceptions import AlreadyExists, FailedPrecondition, NotFound
+from app.services.firebase_service import FirebaseService
+
+
+class FakeSnapshot:
+    def __init__(self, doc_id, data, update_time):
+        self.id = doc_id
+        self.exists = data is not None
+        self.update_time = update_time
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data)
+
+    def get(self, field):
+        return self._data[field]
+
+
+class FakeWriteOption:
+    def __init__(self, last_update_time):
+        self.last_update_time = last_update_time
+
+
+class FakeDocument:
+    def __init__(self, db, collection, doc_id):
+        self.db = db
+        self.docs = db.collections.setdefault(collection, {})
+        self.key = (collection, doc_id)
+        self.id = doc_id
+
+    async def get(self):
+        # Snapshot taken when the read starts, returned once released
+        data = self.docs.get(self.id)
+        update_time = self.db.update_times.get(self.key)
+        self.db.reads += 1
+        await self.db.release.wait()
+        # Lets concurrent writers interleave between a read and a write
+        await asyncio.sleep(0)
+        return FakeSnapshot(self.id, data, update_time)
+
+    def _check(self, option):
+        if self.id not in self.docs:
+            raise NotFound("No document to update")
+        if option and option.last_update_time != self.db.update_times[self.key]:
+            raise FailedPrecondition("Document changed")
+
+    def _touch(self):
+        self.db.clock += 1
+        self.db.update_times[self.key] = self.db.clock
+
+    async def create(self, data):
+        if self.id in self.docs:
+            raise AlreadyExists("Document already exists")
+        self.docs[self.id] = dict(data)
+        self._touch()
+
+    async def set(self, data, merge=False):
+        self.docs[self.id] = {**self.docs.get(self.id, {}), **data} if merge else dict(data)
+        self._touch()
+
+    async def update(self, data, option=None):
+        self._check(option)
+        self.docs[self.id] = {**self.docs[self.id], **data}
+        self._touch()
+
+    async def delete(self, option=None):
+        self._check(option)
+        del self.docs[self.id]
+
+
+class FakeCollection:
+    def __init__(self, db, name):
+        self.db = db
+        self.name = name
+
+    def document(self, doc_id):
+        return FakeDocument(self.db, self.name, doc_id)
+
+
+class FakeDb:
+    """In-memory Firestore with the preconditions leases rely on"""
+
+    def __init__(self, collections=None):
+        self.collections = collections or {}
+        self.update_times = {}
+        self.clock = 0
+        self.reads = 0
+        self.release = asyncio.Event()
+
+    def collection(self, name):
+        return FakeCollection(self, name)
+
+    def write_option(self, last_update_time):
+        return FakeWriteOption(last_update_time)
+
+
+async def wait_for_reads(db, count):
+    for _ in range(100):
+        if db.reads >= count:
+            return
+        await asyncio.sleep(0)
+    db.release.set()
+    raise AssertionError(f"expected {count} Firestore reads, got {db.reads}")
+
+
+class FakeFirebaseService(FirebaseService):
+    def __init__(self, db):
+        super().__init__()
+        self.fake_db = db
+
+    @property
+    def db(self):
+        return self.fake_db
+
+
+def test_read_started_before_write_does_not_refill_cache():
+    """Test that a stale read finishing after an update isn't cached"""
+    async def run():
+        db = FakeDb({"interviews": {"i1": {"id": "i1", "status": "in_progress"}}})
+        service = FakeFirebaseService(db)
+
+        stale_read = asyncio.ensure_future(service.get_document("interviews", "i1"))
+        await wait_for_reads(db, 1)
+        await service.update_document("interviews", "i1", {"status": "completed"})
+        db.release.set()
+
+        assert (await stale_read)["status"] == "in_progress"
+        assert (await service.get_document("interviews", "i1"))["status"] == "completed"
+
+    asyncio.run(run())
+
+
+def test_read_after_write_does_not_join_older_read():
+    """Test that a caller arriving after a write starts its own read"""
+    async def run():
+        db = FakeDb({"interviews": {"i1": {"id": "i1", "status": "in_progress"}}})
+        service = FakeFirebaseService(db)
+
+        stale_read = asyncio.ensure_future(service.get_document("interviews", "i1"))
+        await wait_for_reads(db, 1)
+        await service.update_document("interviews", "i1", {"status": "completed"})
+        fresh_read = asyncio.ensure_future(service.get_document("interviews", "i1"))
+        await wait_for_reads(db, 2)
+        db.release.set()
+
+        assert (await stale_read)["status"] == "in_progress"
+        assert (await fresh_read)["status"] == "completed"
+        assert db.reads == 2
+        assert service._generations == {}
+
+    asyncio.run(run())
+
+
+def test_concurrent_reads_share_one_call_and_fill_cache():
+    """Test that identical reads are coalesced and the result cached"""
+    async def run():
+        db = FakeDb({"interviews": {"i1": {"id": "i1", "status": "in_progress"}}})
+        service = FakeFirebaseService(db)
+
+        reads = asyncio.gather(*(
+            service.get_document("interviews", "i1") for _ in range(3)
+        ))
+        await wait_for_reads(db, 1)
+        db.release.set()
+        results = await reads
+
+        assert db.reads == 1
+        assert all(doc["status"] == "in_progress" for doc in results)
+        await service.get_document("interviews", "i1")
+        assert db.reads == 1
+
+    asyncio.run(run())
+
+
+def test_stream_documents_rejects_unknown_cursor_up_front():
+    """Test that a bad cursor fails before any document is streamed"""
+    async def run():
+        db = FakeDb({})
+        db.release.set()
+        service = FakeFirebaseService(db)
+
+        try:
+            await service.stream_documents("interviews", start_after="missing")
+        except ValueError as e:
+            return str(e)
+
+    assert asyncio.run(run()) == "Invalid cursor"
+
+
+def make_lease_service():
+    db = FakeDb()
+    db.release.set()
+    return db, FakeFirebaseService(db)
+
+
+def test_acquire_lease_is_exclusive_while_valid():
+    """Test that a held, unexpired lease can't be acquired by another owner"""
+    async def run():
+        db, service = make_lease_service()
+
+        first = await service.acquire_lease("leases", "i1", "a", 60)
+        second = await service.acquire_lease("leases", "i1", "b", 60)
+        return first, second, db.collections["leases"]["i1"]["owner"]
+
+    assert asyncio.run(run()) == (True, False, "a")
+
+
+def test_expired_lease_is_taken_over_by_exactly_one_contender():
+    """Test that concurrent takeovers of an expired lease have one winner"""
+    async def run():
+        db, service = make_lease_service()
+        await service.acquire_lease("leases", "i1", "dead", -1)
+
+        results = await asyncio.gather(*(
+            service.acquire_lease("leases", "i1", owner, 60)
+            for owner in ("a", "b", "c")
+        ))
+        return results, db.collections["leases"]["i1"]["owner"]
+
+    results, owner = asyncio.run(run())
+    assert sorted(results) == [False, False, True]
+    assert owner == "abc"[results.index(True)]
+
+
+def test_renew_lease_extends_only_for_the_holder():
+    """Test that renewals move expires_at and fail once the lease is lost"""
+    async def run():
+        db, service = make_lease_service()
+        await service.acquire_lease("leases", "i1", "a", 1)
+        before = db.collections["leases"]["i1"]["expires_at"]
+
+        renewed = await service.renew_lease("leases", "i1", "a", 60)
+        after = db.collections["leases"]["i1"]["expires_at"]
+
+        # The lease expires and another owner takes it over
+        db.collections["leases"]["i1"]["expires_at"] = 0
+        taken = await service.acquire_lease("leases", "i1", "b", 60)
+        lost = await service.renew_lease("leases", "i1", "a", 60)
+        return renewed, after > before, taken, lost
+
+    assert asyncio.run(run()) == (True, True, True, False)
+
+
+def test_release_lease_only_deletes_own_lease():
+    """Test that a stale owner's release leaves the new holder's lease"""
+    async def run():
+        db, service = make_lease_service()
+        await service.acquire_lease("leases", "i1", "a", -1)
+        await service.acquire_lease("leases", "i1", "b", 60)
+
+        await service.release_lease("leases", "i1", "a")
+        kept = "i1" in db.collections["leases"]
+        await service.release_lease("leases", "i1", "b")
+        return kept, "i1" in db.collections["leases"]
+
+    assert asyncio.run(run()) == (True, False)
@@ -0,0 +1,63 @@
+import asyncio
+import pytest
+from app.services.gemini_client import GeminiClient
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeModel:
+    """Stands in for genai.GenerativeModel and tracks peak concurrency"""
+
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+
+    async def generate_content_async(self, prompt):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return FakeResponse(f"echo: {prompt}")
+
+
+def make_client(max_concurrency=2, timeout=1.0, delay=0.01):
+    client = GeminiClient("test-model", max_concurrency=max_concurrency, timeout=timeout)
+    client.model = FakeModel(delay=delay)
+    return client
+
+
+def test_generate_returns_text():
+    """Test that generate awaits the model and returns its text"""
+    client = make_client()
+    
+    assert asyncio.run(client.generate("hello")) == "echo: hello"
+    assert client.metrics()["completed"] == 1
+
+
+def test_concurrency_limit():
+    """Test that concurrent calls never exceed the configured limit"""
+    client = make_client(max_concurrency=2)
+    
+    async def run():
+        return await asyncio.gather(*(client.generate(str(i)) for i in range(6)))
+    
+    results = asyncio.run(run())
+    
+    assert len(results) == 6
+    assert client.model.peak == 2
+    assert client.metrics()["in_flight"] == 0
+    assert client.metrics()["queue_depth"] == 0
+
+
+def test_timeout():
+    """Test that slow calls time out and are counted"""
+    client = make_client(timeout=0.01, delay=0.5)
+    
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(client.generate("slow"))
+    
+    assert client.metrics()["timed_out"] == 1
@@ -0,0 +1,180 @@
+import asyncio
+import json
+import os
+
+# Settings are read at import time; these tests never reach the API
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("FIREBASE_STORAGE_BUCKET", "test-bucket")
+os.environ.setdefault("GEMINI_API_KEY", "test-key")
+
+from app.services.gemini_service import GeminiService
+
+
+def make_evaluation(index=None, score=7.0, feedback="Good answer"):
+    evaluation = {
+        "accuracy": score,
+        "relevance": score,
+        "communication": score,
+        "clarity": score,
+        "confidence": score,
+        "feedback": feedback
+    }
+    if index is not None:
+        evaluation["index"] = index
+    return evaluation
+
+
+def make_items(count):
+    return [
+        {
+            "question": f"Question {idx}",
+            "answer": f"Answer {idx}",
+            "expected_keywords": ["python"]
+        }
+        for idx in range(count)
+    ]
+
+
+def make_service(batch_response, single_response=None):
+    """GeminiService whose generate_text returns canned responses"""
+    service = GeminiService()
+    service.batch_prompts = 0
+    service.single_prompts = []
+    
+    async def generate_text(prompt):
+        if "JSON array" in prompt:
+            service.batch_prompts += 1
+            return batch_response
+        service.single_prompts.append(prompt)
+        if isinstance(single_response, Exception):
+            raise single_response
+        return single_response or json.dumps(make_evaluation(score=5.0))
+    
+    service.generate_text = generate_text
+    return service
+
+
+def test_batch_results_follow_indices():
+    """Test that results are placed by index, not response order"""
+    response = json.dumps([
+        make_evaluation(index=1, score=9.0),
+        make_evaluation(index=0, score=3.0)
+    ])
+    service = make_service(response)
+    
+    results = asyncio.run(service.evaluate_answers_batch(make_items(2)))
+    
+    assert [result["accuracy"] for result in results] == [3.0, 9.0]
+    assert "index" not in results[0]
+    assert service.batch_prompts == 1
+    assert service.single_prompts == []
+
+
+def test_missing_index_falls_back_to_single_item():
+    """Test that an item the batch omits is evaluated on its own"""
+    response = json.dumps([make_evaluation(index=0, score=9.0)])
+    service = make_service(response)
+    
+    results = asyncio.run(service.evaluate_answers_batch(make_items(2)))
+    
+    assert results[0]["accuracy"] == 9.0
+    assert results[1]["accuracy"] == 5.0
+    assert len(service.single_prompts) == 1
+    assert "Question 1" in service.single_prompts[0]
+
+
+def test_duplicate_index_keeps_first_entry():
+    """Test that a repeated index doesn't overwrite the first result"""
+    response = json.dumps([
+        make_evaluation(index=0, score=9.0),
+        make_evaluation(index=0, score=1.0),
+        make_evaluation(index=1, score=8.0)
+    ])
+    service = make_service(response)
+    
+    results = asyncio.run(service.evaluate_answers_batch(make_items(2)))
+    
+    assert [result["accuracy"] for result in results] == [9.0, 8.0]
+    assert service.single_prompts == []
+
+
+def test_out_of_range_and_bad_indices_fall_back():
+    """Test that invalid scores and indices are re-evaluated individually"""
+    response = json.dumps([
+        make_evaluation(index=0, score=11.0),
+        make_evaluation(index=5, score=8.0),
+        make_evaluation(index="1", score=8.0)
+    ])
+    service = make_service(response)
+    
+    results = asyncio.run(service.evaluate_answers_batch(make_items(2)))
+    
+    assert [result["accuracy"] for result in results] == [5.0, 5.0]
+    assert len(service.single_prompts) == 2
+
+
+def test_non_list_response_falls_back():
+    """Test that a JSON object instead of an array is ignored"""
+    service = make_service(json.dumps(make_evaluation(index=0)))
+    
+    results = asyncio.run(service.evaluate_answers_batch(make_items(2)))
+    
+    assert all(result["accuracy"] == 5.0 for result in results)
+    assert len(service.single_prompts) == 2
+
+
+def test_invalid_json_falls_back():
+    """Test that an unparseable batch response falls back for every item"""
+    service = make_service("not json at all")
+    
+    results = asyncio.run(service.evaluate_answers_batch(make_items(3)))
+    
+    assert all(result["accuracy"] == 5.0 for result in results)
+    assert len(service.single_prompts) == 3
+
+
+def test_fenced_json_is_parsed():
+    """Test that markdown code fences around the array are stripped"""
+    response = "```json\n" + json.dumps([
+        make_evaluation(index=0),
+        make_evaluation(index=1)
+    ]) + "\n```"
+    service = make_service(response)
+    
+    results = asyncio.run(service.evaluate_answers_batch(make_items(2)))
+    
+    assert all(result["accuracy"] == 7.0 for result in results)
+    assert service.single_prompts == []
+
+
+def test_failed_fallback_returns_none():
+    """Test that items failing both ways come back as None"""
+    service = make_service("not json", single_response=RuntimeError("boom"))
+    
+    results = asyncio.run(service.evaluate_answers_batch(make_items(2)))
+    
+    assert results == [None, None]
+
+
+def test_single_item_skips_batch_prompt():
+    """Test that one item goes straight to the single-item path"""
+    service = make_service("unused")
+    
+    results = asyncio.run(service.evaluate_answers_batch(make_items(1)))
+    
+    assert results[0]["accuracy"] == 5.0
+    assert service.batch_prompts == 0
+
+
+def test_is_valid_evaluation():
+    """Test criterion type, range and feedback checks"""
+    assert GeminiService._is_valid_evaluation(make_evaluation(score=0))
+    assert GeminiService._is_valid_evaluation(make_evaluation(score=10))
+    assert not GeminiService._is_valid_evaluation(make_evaluation(score=-1))
+    assert not GeminiService._is_valid_evaluation(make_evaluation(score=True))
+    assert not GeminiService._is_valid_evaluation(make_evaluation(score="7"))
+    assert not GeminiService._is_valid_evaluation(make_evaluation(feedback=None))
+    
+    incomplete = make_evaluation()
+    del incomplete["clarity"]
+    assert not GeminiService._is_valid_evaluation(incomplete)
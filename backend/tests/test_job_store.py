@@ -0,0 +1,122 @@
+import pytest
+from app.services.job_store import SQLiteJobStore
+from app.utils.constants import JobStatus
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Job store backed by a temporary SQLite file"""
+    job_store = SQLiteJobStore(str(tmp_path / "jobs.sqlite3"))
+    yield job_store
+    job_store.close()
+
+
+def test_add_deduplicates_pending_jobs(store):
+    """Test that a pending job with the same ID is not queued twice"""
+    assert store.add("evaluation:i1", "evaluation", "i1", {"interview_id": "i1"})
+    assert not store.add("evaluation:i1", "evaluation", "i1", {"interview_id": "i1"})
+
+
+def test_claim_and_complete(store):
+    """Test that a claimed job is leased and can be completed"""
+    store.add("evaluation:i1", "evaluation", "i1", {"interview_id": "i1"})
+    
+    job = store.claim("worker-a", lease_seconds=60)
+    
+    assert job["status"] == JobStatus.RUNNING
+    assert job["attempts"] == 1
+    assert job["payload"] == {"interview_id": "i1"}
+    assert store.claim("worker-b", lease_seconds=60) is None
+    
+    store.complete(job["id"], "worker-a")
+    
+    assert store.get(job["id"])["status"] == JobStatus.DONE
+
+
+def test_expired_lease_is_reclaimed(store):
+    """Test that a job survives its worker dying mid-run"""
+    store.add("evaluation:i1", "evaluation", "i1", {"interview_id": "i1"})
+    store.claim("worker-a", lease_seconds=0)
+    
+    # Reopen the file as a restarted process would
+    restarted = SQLiteJobStore(store.path)
+    job = restarted.claim("worker-b", lease_seconds=60)
+    restarted.close()
+    
+    assert job["id"] == "evaluation:i1"
+    assert job["lease_owner"] == "worker-b"
+    assert job["attempts"] == 2
+
+
+def test_retry_then_dead_letter(store):
+    """Test backoff release and dead-lettering"""
+    store.add("evaluation:i1", "evaluation", "i1", {"interview_id": "i1"})
+    job = store.claim("worker-a", lease_seconds=60)
+    
+    store.retry(job["id"], "worker-a", "boom", delay=3600)
+    
+    assert store.get(job["id"])["status"] == JobStatus.QUEUED
+    assert store.claim("worker-a", lease_seconds=60) is None  # still backing off
+    
+    store.dead_letter(job["id"], None, "boom")
+    
+    assert [j["id"] for j in store.dead_letters()] == ["evaluation:i1"]
+    assert store.requeue(job["id"])
+    assert store.claim("worker-a", lease_seconds=60)["attempts"] == 1
+
+
+def test_release_on_shutdown(store):
+    """Test that a graceful shutdown hands leased jobs back"""
+    store.add("evaluation:i1", "evaluation", "i1", {"interview_id": "i1"})
+    store.claim("worker-a", lease_seconds=60)
+    
+    assert store.release("worker-a") == 1
+    
+    job = store.claim("worker-b", lease_seconds=60)
+    assert job["attempts"] == 1
+
+
+def test_claims_highest_priority_first(store):
+    """Test that higher priority jobs are claimed before older low priority ones"""
+    store.add("answer_evaluation:a1", "answer_evaluation", "a1", {}, priority=0)
+    store.add("question_generation:i1", "question_generation", "i1", {}, priority=2)
+    store.add("evaluation:i2", "evaluation", "i2", {}, priority=1)
+    
+    claimed = [store.claim("worker-a", lease_seconds=60)["id"] for _ in range(3)]
+    
+    assert claimed == [
+        "question_generation:i1",
+        "evaluation:i2",
+        "answer_evaluation:a1"
+    ]
+
+
+def test_min_priority_skips_background_jobs(store):
+    """Test that priority workers leave low priority jobs alone"""
+    store.add("answer_evaluation:a1", "answer_evaluation", "a1", {}, priority=0)
+    
+    assert store.claim("worker-a", lease_seconds=60, min_priority=1) is None
+    assert store.claim("worker-a", lease_seconds=60)["id"] == "answer_evaluation:a1"
+
+
+def test_adds_priority_column_to_old_files(tmp_path):
+    """Test that a job file created before priorities is migrated"""
+    import sqlite3
+    
+    path = str(tmp_path / "old.sqlite3")
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE jobs (
+            id TEXT PRIMARY KEY, job_type TEXT NOT NULL, key TEXT NOT NULL,
+            payload TEXT NOT NULL, status TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0, available_at REAL NOT NULL,
+            lease_owner TEXT, lease_expires_at REAL, error TEXT,
+            created_at REAL NOT NULL, updated_at REAL NOT NULL
+        )
+    """)
+    conn.close()
+    
+    old_store = SQLiteJobStore(path)
+    assert old_store.add("evaluation:i1", "evaluation", "i1", {}, priority=1)
+    assert old_store.claim("worker-a", lease_seconds=60)["priority"] == 1
+    old_store.close()
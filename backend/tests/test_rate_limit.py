@@ -0,0 +1,52 @@
+import time
+from app.utils.rate_limit import SlidingWindowLimiter, forwarded_client_ip
+
+
+def test_admits_up_to_limit():
+    """Test that hits beyond the limit are refused with a retry delay"""
+    limiter = SlidingWindowLimiter(limit=2, window=60)
+    
+    assert limiter.hit("1.2.3.4") == 0
+    assert limiter.hit("1.2.3.4") == 0
+    assert 0 < limiter.hit("1.2.3.4") <= 60
+    assert limiter.hit("5.6.7.8") == 0
+
+
+def test_window_slides():
+    """Test that old hits stop counting once the window passes"""
+    limiter = SlidingWindowLimiter(limit=1, window=0.01)
+    
+    assert limiter.hit("ip") == 0
+    time.sleep(0.02)
+    assert limiter.hit("ip") == 0
+
+
+def test_tracked_keys_are_bounded():
+    """Test that the least recently seen keys are dropped"""
+    limiter = SlidingWindowLimiter(limit=1, window=60, maxsize=2)
+    
+    limiter.hit("a")
+    limiter.hit("b")
+    limiter.hit("c")
+    
+    # "a" was evicted, so it starts over
+    assert limiter.hit("a") == 0
+
+
+def test_spoofed_forwarded_entries_share_a_bucket():
+    """Test that client-sent X-Forwarded-For entries don't change the key"""
+    limiter = SlidingWindowLimiter(limit=1, window=60)
+    
+    first = forwarded_client_ip("1.1.1.1, 203.0.113.9", "10.0.0.1", trusted_hops=1)
+    second = forwarded_client_ip("2.2.2.2, 203.0.113.9", "10.0.0.1", trusted_hops=1)
+    
+    assert first == second == "203.0.113.9"
+    assert limiter.hit(first) == 0
+    assert limiter.hit(second) > 0
+
+
+def test_forwarded_client_ip_falls_back_to_peer():
+    """Test that the peer address is used without enough proxy entries"""
+    assert forwarded_client_ip(None, "10.0.0.1", trusted_hops=1) == "10.0.0.1"
+    assert forwarded_client_ip("1.1.1.1", "10.0.0.1", trusted_hops=0) == "10.0.0.1"
+    assert forwarded_client_ip("1.1.1.1", "10.0.0.1", trusted_hops=2) == "10.0.0.1"
@@ -0,0 +1,96 @@
+import asyncio
+from app.utils.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    """Test that concurrent callers for a key share a single call"""
+    flight = SingleFlight()
+    calls = 0
+    
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"value": 1}
+    
+    async def run():
+        return await asyncio.gather(*(flight.do("key", fetch) for _ in range(5)))
+    
+    results = asyncio.run(run())
+    
+    assert calls == 1
+    assert all(result == {"value": 1} and shared for result, shared in results)
+    assert len(flight) == 0
+
+
+def test_different_keys_run_separately():
+    """Test that calls for different keys are not coalesced"""
+    flight = SingleFlight()
+    
+    async def run():
+        async def fetch(value):
+            await asyncio.sleep(0.01)
+            return value
+        
+        return await asyncio.gather(
+            flight.do("a", lambda: fetch("a")),
+            flight.do("b", lambda: fetch("b"))
+        )
+    
+    assert asyncio.run(run()) == [("a", False), ("b", False)]
+
+
+def test_sequential_calls_are_not_cached():
+    """Test that a finished call is not reused"""
+    flight = SingleFlight()
+    calls = 0
+    
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        return calls
+    
+    async def run():
+        first = await flight.do("key", fetch)
+        second = await flight.do("key", fetch)
+        return first, second
+    
+    assert asyncio.run(run()) == ((1, False), (2, False))
+
+
+def test_exception_propagates_to_all_callers():
+    """Test that every waiting caller sees the failure"""
+    flight = SingleFlight()
+    
+    async def fetch():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+    
+    async def run():
+        return await asyncio.gather(
+            *(flight.do("key", fetch) for _ in range(3)),
+            return_exceptions=True
+        )
+    
+    results = asyncio.run(run())
+    
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(flight) == 0
+
+
+def test_cancelled_caller_does_not_cancel_others():
+    """Test that cancelling one waiter leaves the shared call running"""
+    flight = SingleFlight()
+    
+    async def fetch():
+        await asyncio.sleep(0.02)
+        return "done"
+    
+    async def run():
+        first = asyncio.ensure_future(flight.do("key", fetch))
+        second = asyncio.ensure_future(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+    
+    assert asyncio.run(run()) == ("done", True)
@@ -0,0 +1,53 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Generous for slow CI machines; importing the SDKs below alone costs more
+IMPORT_BUDGET_SECONDS = 3.0
+
+# Heavy SDKs that must only load on first use, never at import time
+LAZY_MODULES = (
+    "google.generativeai",
+    "speech_recognition",
+    "google.cloud.firestore_v1",
+    "firebase_admin",
+    "grpc"
+)
+
+SCRIPT = f"""
+import sys, time
+started = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - started
+loaded = ",".join(m for m in {LAZY_MODULES!r} if m in sys.modules)
+print(f"{{elapsed}}|{{loaded}}")
+"""
+
+
+def test_app_imports_fast_without_credentials():
+    """Test that importing the app needs no credentials and skips heavy SDKs"""
+    env = {
+        **os.environ,
+        "SECRET_KEY": "test-secret",
+        "FIREBASE_STORAGE_BUCKET": "test-bucket",
+        "GEMINI_API_KEY": "test-key",
+        "FIREBASE_CREDENTIALS_PATH": "/nonexistent/credentials.json"
+    }
+    env.pop("FIREBASE_CREDENTIALS", None)
+    
+    result = subprocess.run(
+        [sys.executable, "-c", SCRIPT],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True
+    )
+    
+    assert result.returncode == 0, result.stderr
+    elapsed, loaded = result.stdout.strip().splitlines()[-1].split("|")
+    assert float(elapsed) < IMPORT_BUDGET_SECONDS
+    assert loaded == ""
@@ -0,0 +1,120 @@
+import asyncio
+import os
+
+# Settings are read at import time; these tests never reach Cloud Storage
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("FIREBASE_STORAGE_BUCKET", "test-bucket")
+os.environ.setdefault("GEMINI_API_KEY", "test-key")
+
+from app.services.storage_service import StorageService
+
+
+class FakeWriter:
+    def __init__(self):
+        self.data = b""
+        self.closed = False
+        self.terminated = False
+
+    def write(self, data):
+        self.data += data
+
+    def close(self):
+        self.closed = True
+
+    def terminate(self):
+        self.terminated = True
+
+
+class FakeBlob:
+    public_url = "https://storage.example/answer.webm"
+
+    def __init__(self):
+        self.writer = FakeWriter()
+        self.public = False
+
+    def open(self, mode, **kwargs):
+        return self.writer
+
+    def make_public(self):
+        self.public = True
+
+
+class FakeBucket:
+    def __init__(self):
+        self.blob_ = FakeBlob()
+
+    def blob(self, name):
+        return self.blob_
+
+
+class FakeStorageService(StorageService):
+    def __init__(self):
+        self.fake_bucket = FakeBucket()
+
+    @property
+    def bucket(self):
+        return self.fake_bucket
+
+
+async def stream(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def test_upload_stream_writes_and_publishes():
+    """Test that a normal stream is written, closed and made public"""
+    service = FakeStorageService()
+
+    url = asyncio.run(service.upload_stream(stream(b"ab", b"cd"), "a.webm", "audio/webm", 10))
+
+    blob = service.fake_bucket.blob_
+    assert url == FakeBlob.public_url
+    assert blob.writer.data == b"abcd"
+    assert blob.writer.closed and blob.public
+    assert not blob.writer.terminated
+
+
+def test_upload_stream_terminates_oversize_upload():
+    """Test that exceeding max_bytes cancels the upload session"""
+    service = FakeStorageService()
+
+    try:
+        asyncio.run(service.upload_stream(stream(b"abc", b"def"), "a.webm", "audio/webm", 4))
+        raised = False
+    except ValueError:
+        raised = True
+
+    writer = service.fake_bucket.blob_.writer
+    assert raised
+    assert writer.terminated and not writer.closed
+
+
+def test_upload_stream_terminates_on_client_error():
+    """Test that a failing body stream cancels the upload session"""
+    service = FakeStorageService()
+
+    async def broken():
+        yield b"abc"
+        raise ConnectionError("client disconnected")
+
+    try:
+        asyncio.run(service.upload_stream(broken(), "a.webm", "audio/webm", 10))
+        raised = False
+    except ConnectionError:
+        raised = True
+
+    writer = service.fake_bucket.blob_.writer
+    assert raised
+    assert writer.terminated and not writer.closed
+
+
+def test_upload_stream_stores_nothing_for_empty_body():
+    """Test that an empty stream returns None without creating an object"""
+    service = FakeStorageService()
+
+    url = asyncio.run(service.upload_stream(stream(), "a.webm", "audio/webm", 10))
+
+    blob = service.fake_bucket.blob_
+    assert url is None
+    assert blob.writer.terminated and not blob.writer.closed
+    assert not blob.public
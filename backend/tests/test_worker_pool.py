@@ -0,0 +1,58 @@
+import asyncio
+import threading
+import time
+from app.utils.worker_pool import PoolBusy, WorkerPool
+
+
+def test_runs_off_the_event_loop():
+    """Test that calls run on pool threads and return their result"""
+    pool = WorkerPool(workers=2, max_queue=4)
+    
+    async def run():
+        return await pool.run(lambda: threading.current_thread().name)
+    
+    assert asyncio.run(run()) != threading.current_thread().name
+    assert pool.metrics()["completed"] == 1
+    pool.shutdown()
+
+
+def test_concurrency_is_bounded():
+    """Test that no more than `workers` calls run at once"""
+    pool = WorkerPool(workers=2, max_queue=10)
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+    
+    def work():
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+    
+    async def run():
+        await asyncio.gather(*(pool.run(work) for _ in range(6)))
+    
+    asyncio.run(run())
+    
+    assert peak == 2
+    pool.shutdown()
+
+
+def test_rejects_when_queue_is_full():
+    """Test that calls beyond the queue bound fail fast"""
+    pool = WorkerPool(workers=1, max_queue=1)
+    
+    async def run():
+        return await asyncio.gather(
+            *(pool.run(time.sleep, 0.02) for _ in range(4)),
+            return_exceptions=True
+        )
+    
+    results = asyncio.run(run())
+    
+    assert sum(isinstance(result, PoolBusy) for result in results) == 2
+    assert pool.metrics()["rejected"] == 2
+    pool.shutdown()
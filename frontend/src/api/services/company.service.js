@@ -1,5 +1,5 @@
 import axiosInstance from '../axios.config';
-import { API_ENDPOINTS } from '@/utils/constants';
+import { API_ENDPOINTS, INTERVIEWS_PAGE_SIZE, MAX_PAGE_SIZE } from '@/utils/constants';
 
 export const companyService = {
   createInterview: async (data) => {
@@ -10,11 +10,32 @@ export const companyService = {
     return response.data;
   },
 
-  getInterviews: async () => {
+  // One page of interviews, newest first; pass nextCursor back for the next
+  getInterviews: async ({ limit = INTERVIEWS_PAGE_SIZE, cursor, fields } = {}) => {
     const response = await axiosInstance.get(
-      API_ENDPOINTS.COMPANY_INTERVIEWS
+      API_ENDPOINTS.COMPANY_INTERVIEWS,
+      { params: { limit, cursor, fields } }
     );
-    return response.data;
+    return {
+      interviews: response.data,
+      nextCursor: response.headers['x-next-cursor'] || null,
+    };
+  },
+
+  // Every interview, following X-Next-Cursor page by page
+  getAllInterviews: async ({ fields } = {}) => {
+    const interviews = [];
+    let cursor;
+    do {
+      const page = await companyService.getInterviews({
+        limit: MAX_PAGE_SIZE,
+        cursor,
+        fields,
+      });
+      interviews.push(...page.interviews);
+      cursor = page.nextCursor;
+    } while (cursor);
+    return interviews;
   },
 
   getEvaluation: async (interviewId) => {
@@ -16,6 +16,15 @@ export const interviewService = {
     return response.data;
   },
 
+  uploadAnswerAudio: async (interviewId, questionId, blob) => {
+    const response = await axiosInstance.put(
+      `${API_ENDPOINTS.GET_INTERVIEW}/${interviewId}/answers/${encodeURIComponent(questionId)}/audio`,
+      blob,
+      { headers: { 'Content-Type': blob.type || 'audio/webm' } }
+    );
+    return response.data;
+  },
+
   submitAnswer: async (answerData) => {
     const response = await axiosInstance.post(
       API_ENDPOINTS.SUBMIT_ANSWER,
@@ -39,9 +39,14 @@ const CandidateDashboard = () => {
   const fetchInterviews = async () => {
     try {
       setLoading(true);
-      const data = await candidateService.getInterviews();
-      setInterviews(data);
-      calculateStats(data);
+      // Only the recent list needs full rows; stats walk the pages with just
+      // the status field
+      const [recentPage, statsRows] = await Promise.all([
+        candidateService.getInterviews({ limit: 6 }),
+        candidateService.getAllInterviews({ fields: 'status' }),
+      ]);
+      setInterviews(recentPage.interviews);
+      calculateStats(statsRows);
     } catch (err) {
       setError('Failed to load interviews');
       console.error(err);
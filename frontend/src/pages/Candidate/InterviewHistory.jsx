@@ -23,6 +23,8 @@ const InterviewHistory = () => {
   const [interviews, setInterviews] = useState([]);
   const [filteredInterviews, setFilteredInterviews] = useState([]);
   const [loading, setLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [error, setError] = useState('');
   const [searchTerm, setSearchTerm] = useState('');
   const [statusFilter, setStatusFilter] = useState('all');
@@ -38,9 +40,10 @@ const InterviewHistory = () => {
   const fetchInterviews = async () => {
     try {
       setLoading(true);
-      const data = await candidateService.getInterviews();
-      setInterviews(data);
-      setFilteredInterviews(data);
+      const page = await candidateService.getInterviews();
+      setInterviews(page.interviews);
+      setFilteredInterviews(page.interviews);
+      setNextCursor(page.nextCursor);
     } catch (err) {
       setError('Failed to load interviews');
       console.error(err);
@@ -49,6 +52,20 @@ const InterviewHistory = () => {
     }
   };
 
+  const loadMoreInterviews = async () => {
+    try {
+      setLoadingMore(true);
+      const page = await candidateService.getInterviews({ cursor: nextCursor });
+      setInterviews((prev) => [...prev, ...page.interviews]);
+      setNextCursor(page.nextCursor);
+    } catch (err) {
+      setError('Failed to load more interviews');
+      console.error(err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const filterInterviews = () => {
     let filtered = [...interviews];
 
@@ -235,6 +252,14 @@ const InterviewHistory = () => {
           ))}
         </div>
       )}
+
+      {nextCursor && (
+        <div className="load-more">
+          <Button variant="outline" loading={loadingMore} onClick={loadMoreInterviews}>
+            Load more
+          </Button>
+        </div>
+      )}
     </div>
   );
 };
@@ -16,7 +16,7 @@ const CandidatesList = () => {
   const fetchCandidates = async () => {
     try {
       setLoading(true);
-      const interviews = await companyService.getInterviews();
+      const interviews = await companyService.getAllInterviews();
       
       // Extract unique candidates
       const uniqueCandidates = {};
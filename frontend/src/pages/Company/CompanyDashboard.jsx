@@ -38,14 +38,17 @@ const CompanyDashboard = () => {
   const fetchDashboardData = async () => {
     try {
       setLoading(true);
-      const [interviewsData, evaluationsData] = await Promise.all([
-        companyService.getInterviews(),
+      // Only the recent list needs full rows; stats walk the pages with just
+      // the fields they count
+      const [recentPage, statsRows, evaluationsData] = await Promise.all([
+        companyService.getInterviews({ limit: 6 }),
+        companyService.getAllInterviews({ fields: 'status' }),
         companyService.getEvaluationSummary(),
       ]);
 
-      setInterviews(interviewsData);
+      setInterviews(recentPage.interviews);
       setEvaluations(evaluationsData);
-      calculateStats(interviewsData, evaluationsData);
+      calculateStats(statsRows, evaluationsData);
     } catch (err) {
       setError('Failed to load dashboard data');
       console.error(err);
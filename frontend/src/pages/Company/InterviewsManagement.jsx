@@ -13,6 +13,8 @@ const InterviewsManagement = () => {
   const [interviews, setInterviews] = useState([]);
   const [filteredInterviews, setFilteredInterviews] = useState([]);
   const [loading, setLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [searchTerm, setSearchTerm] = useState('');
   const [statusFilter, setStatusFilter] = useState('all');
 
@@ -27,8 +29,9 @@ const InterviewsManagement = () => {
   const fetchInterviews = async () => {
     try {
       setLoading(true);
-      const data = await companyService.getInterviews();
-      setInterviews(data);
+      const page = await companyService.getInterviews();
+      setInterviews(page.interviews);
+      setNextCursor(page.nextCursor);
     } catch (err) {
       console.error('Failed to load interviews:', err);
     } finally {
@@ -36,6 +39,19 @@ const InterviewsManagement = () => {
     }
   };
 
+  const loadMoreInterviews = async () => {
+    try {
+      setLoadingMore(true);
+      const page = await companyService.getInterviews({ cursor: nextCursor });
+      setInterviews((prev) => [...prev, ...page.interviews]);
+      setNextCursor(page.nextCursor);
+    } catch (err) {
+      console.error('Failed to load more interviews:', err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const filterInterviews = () => {
     let filtered = [...interviews];
 
@@ -168,6 +184,13 @@ const InterviewsManagement = () => {
             </tbody>
           </table>
         </div>
+        {nextCursor && (
+          <div className="load-more">
+            <Button variant="outline" loading={loadingMore} onClick={loadMoreInterviews}>
+              Load more
+            </Button>
+          </div>
+        )}
       </Card>
     </div>
   );
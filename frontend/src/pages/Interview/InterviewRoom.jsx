@@ -1,6 +1,7 @@
 import React, { useState, useEffect, useRef } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
 import { useInterviewContext } from '@/context/InterviewContext';
+import { interviewService } from '@/api';
 import { useMediaRecorder } from '@/hooks/useMediaRecorder';
 import { useWebcam } from '@/hooks/useWebcam';
 import { useTimer } from '@/hooks/useTimer';
@@ -109,13 +110,20 @@ const InterviewRoom = () => {
       stop(); // Stop timer
 
       // Stop recording and get the data
-      const { base64 } = await stopRecording();
+      const { blob } = await stopRecording();
+
+      // Stream the raw recording to storage instead of inlining it as base64
+      const { upload_id } = await interviewService.uploadAnswerAudio(
+        interviewId,
+        currentQuestion.id,
+        blob
+      );
 
       // Prepare answer data
       const answerData = {
         interview_id: interviewId,
         question_id: currentQuestion.id,
-        audio_data: base64,
+        audio_upload_id: upload_id,
         answer_text: '', // Can add speech-to-text here
       };
 
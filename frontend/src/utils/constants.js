@@ -69,6 +69,12 @@ export const API_ENDPOINTS = {
   GENERATE_EVALUATION: '/evaluation/generate',
 };
 
+// Interviews fetched per request; lists load further pages on demand
+export const INTERVIEWS_PAGE_SIZE = 50;
+
+// Largest page the API serves (MAX_PAGE_SIZE), used when walking every page
+export const MAX_PAGE_SIZE = 500;
+
 export const MEDIA_CONSTRAINTS = {
   VIDEO: {
     width: { ideal: 1280 },